@@ -5,9 +5,11 @@ Module 10: Central hub for all analytics – paid, organic, web, and conversion
 """
 
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date, timedelta
+import asyncio
 import pymysql
 import json
 from openai import OpenAI
@@ -1238,12 +1240,11 @@ async def get_ga4_data(
         
         ga4_data = cursor.fetchall()
         
-        # Convert dates
+        # orjson serializes dates natively but not DECIMAL columns
         for row in ga4_data:
-            if row.get('metric_date'):
-                row['metric_date'] = row['metric_date'].isoformat()
-            if row.get('created_at'):
-                row['created_at'] = row['created_at'].isoformat()
+            for key in ('bounce_rate', 'avg_session_duration'):
+                if row.get(key) is not None:
+                    row[key] = float(row[key])
         
         # Calculate aggregates
         if ga4_data:
@@ -1255,7 +1256,8 @@ async def get_ga4_data(
             avg_bounce_rate = 0
             total_conversions = 0
         
-        return {
+        # Serialize the (potentially large) row list with orjson
+        return ORJSONResponse(content={
             "success": True,
             "client_id": client_id,
             "date_range": {
@@ -1268,7 +1270,7 @@ async def get_ga4_data(
                 "avg_bounce_rate": round(avg_bounce_rate, 2),
                 "total_conversions": total_conversions
             }
-        }
+        })
         
     except Exception as e:
         raise HTTPException(
@@ -1333,27 +1335,48 @@ async def sync_all_platforms(
             "moz": {"success": False, "message": "Not configured"}
         }
         
+        # Use client's ad account or default from settings
+        ad_account_id = None
+        if client_data and client_data.get('meta_ad_account_id'):
+            ad_account_id = client_data['meta_ad_account_id']
+        elif hasattr(settings, 'META_AD_ACCOUNT_ID') and settings.META_AD_ACCOUNT_ID:
+            ad_account_id = settings.META_AD_ACCOUNT_ID
+        
+        async def fetch_meta_ads():
+            from app.services.meta_ads_service import MetaAdsReportingService
+            
+            if not ad_account_id:
+                return None
+            return await MetaAdsReportingService().get_campaign_performance_async(
+                ad_account_id=ad_account_id,
+                start_date=start_date,
+                end_date=end_date
+            )
+        
+        async def fetch_google_ads():
+            from app.services.google_ads_reporting import GoogleAdsReportingService
+            
+            return await GoogleAdsReportingService().get_campaign_performance_async(
+                start_date=start_date,
+                end_date=end_date
+            )
+        
+        # Fetch both ad platforms concurrently; errors are handled per platform below
+        meta_result, google_result = await asyncio.gather(
+            fetch_meta_ads(),
+            fetch_google_ads(),
+            return_exceptions=True
+        )
+        
         # ============================================
         # 1. SYNC META ADS DATA (Facebook/Instagram)
         # ============================================
         try:
-            from app.services.meta_ads_service import MetaAdsReportingService
-            
-            meta_service = MetaAdsReportingService()
-            
-            # Use client's ad account or default from settings
-            ad_account_id = None
-            if client_data and client_data.get('meta_ad_account_id'):
-                ad_account_id = client_data['meta_ad_account_id']
-            elif hasattr(settings, 'META_AD_ACCOUNT_ID') and settings.META_AD_ACCOUNT_ID:
-                ad_account_id = settings.META_AD_ACCOUNT_ID
+            if isinstance(meta_result, Exception):
+                raise meta_result
             
             if ad_account_id:
-                meta_data = meta_service.get_campaign_performance(
-                    ad_account_id=ad_account_id,
-                    start_date=start_date,
-                    end_date=end_date
-                )
+                meta_data = meta_result
                 
                 if meta_data.get('success'):
                     # Store aggregated data in analytics_overview
@@ -1435,14 +1458,10 @@ async def sync_all_platforms(
         # 2. SYNC GOOGLE ADS DATA
         # ============================================
         try:
-            from app.services.google_ads_reporting import GoogleAdsReportingService
-            
-            google_ads_service = GoogleAdsReportingService()
+            if isinstance(google_result, Exception):
+                raise google_result
             
-            google_data = google_ads_service.get_campaign_performance(
-                start_date=start_date,
-                end_date=end_date
-            )
+            google_data = google_result
             
             if google_data.get('success'):
                 summary = google_data.get('summary', {})
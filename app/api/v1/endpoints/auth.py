@@ -3,7 +3,7 @@ PASTE THIS INTO: app/api/v1/endpoints/auth.py (existing file)
 COMPLETE FIXED VERSION
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
@@ -132,7 +132,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 # ========== API ENDPOINTS ==========
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user: UserCreate):
+async def register(user: UserCreate, background_tasks: BackgroundTasks):
     """Register a new user and send OTP verification"""
     
     connection = None
@@ -170,7 +170,8 @@ async def register(user: UserCreate):
             identifier=user.email,
             identifier_type='email',
             purpose='email_verification',
-            user_id=user_id
+            user_id=user_id,
+            background_tasks=background_tasks
         )
         
         # Send Phone OTP if phone provided
@@ -180,7 +181,8 @@ async def register(user: UserCreate):
                 identifier=user.phone,
                 identifier_type='phone',
                 purpose='phone_verification',
-                user_id=user_id
+                user_id=user_id,
+                background_tasks=background_tasks
             )
         
         return {
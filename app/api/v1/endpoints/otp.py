@@ -1,7 +1,7 @@
 """
 OTP API Endpoints
 """
-from fastapi import APIRouter, HTTPException, status, Request
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Request
 from pydantic import BaseModel, EmailStr, validator
 import re
 
@@ -42,7 +42,7 @@ class OTPVerification(BaseModel):
 
 
 @router.post("/send", summary="Send OTP via SMS or Email")
-async def send_otp(request: OTPRequest, req: Request):
+async def send_otp(request: OTPRequest, req: Request, background_tasks: BackgroundTasks):
     """
     Send OTP to phone or email
     """
@@ -59,7 +59,8 @@ async def send_otp(request: OTPRequest, req: Request):
         identifier=request.identifier,
         identifier_type=request.identifier_type,
         purpose=request.purpose,
-        ip_address=ip_address
+        ip_address=ip_address,
+        background_tasks=background_tasks
     )
     
     if result['success']:
@@ -125,8 +126,8 @@ async def verify_otp(verification: OTPVerification):
         
 
 @router.post("/resend", summary="Resend OTP")
-async def resend_otp(request: OTPRequest, req: Request):
+async def resend_otp(request: OTPRequest, req: Request, background_tasks: BackgroundTasks):
     """
     Resend OTP (same as send, but with different endpoint for clarity)
     """
-    return await send_otp(request, req)
\ No newline at end of file
+    return await send_otp(request, req, background_tasks)
\ No newline at end of file
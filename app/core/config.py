@@ -91,6 +91,7 @@ class Settings(BaseSettings):
     META_PAGE_ID: Optional[str] = None
     META_INSTAGRAM_ACCOUNT_ID: Optional[str] = None
     META_PIXEL_ID: Optional[str] = None
+    META_CONVERSION_VALUE: float = 50.0  # Assumed revenue per conversion (for ROAS)
     # ============================================
     
     # Google Ads
@@ -8,6 +8,8 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from typing import Optional
 import pymysql
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
 
@@ -15,18 +17,32 @@ from app.core.config import settings
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/{settings.API_VERSION}/auth/login", auto_error=False)
 
 
+def _connect_mysql() -> pymysql.connections.Connection:
+    return pymysql.connect(
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        database=settings.DB_NAME,
+        cursorclass=pymysql.cursors.DictCursor
+    )
+
+
+# Process-wide MySQL pool (5 kept open, up to 25 in total). close() on a
+# pooled connection rolls back any open transaction and returns it to the pool.
+_db_pool = QueuePool(_connect_mysql, pool_size=5, max_overflow=20, timeout=30)
+
+
+@event.listens_for(_db_pool, "checkout")
+def _ping_connection(dbapi_connection, connection_record, connection_proxy):
+    """Reconnect connections the server dropped while they sat in the pool"""
+    dbapi_connection.ping(reconnect=True)
+
+
 def get_db_connection():
-    """Get MySQL database connection"""
+    """Get MySQL database connection (from the shared pool)"""
     try:
-        connection = pymysql.connect(
-            host=settings.DB_HOST,
-            port=settings.DB_PORT,
-            user=settings.DB_USER,
-            password=settings.DB_PASSWORD,
-            database=settings.DB_NAME,
-            cursorclass=pymysql.cursors.DictCursor
-        )
-        return connection
+        return _db_pool.connect()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -10,7 +10,7 @@ from fastapi import FastAPI, Request, HTTPException, status, Cookie, APIRouter,
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse
 from typing import Optional
 from jose import JWTError, jwt
 from fastapi.responses import FileResponse
@@ -30,6 +30,7 @@ app = FastAPI(
     docs_url=f"/api/{settings.API_VERSION}/docs",
     redoc_url=f"/api/{settings.API_VERSION}/redoc",
     openapi_url=f"/api/{settings.API_VERSION}/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Middleware
@@ -1205,12 +1206,25 @@ async def startup_event():
     print(f"📦 Package selection: http://{settings.HOST}:{settings.PORT}/onboarding/select-package")  # NEW
     print(f" Verification: http://{settings.HOST}:{settings.PORT}/onboarding/verification")  # NEW
     print(f"👨‍💼 Admin verifications: http://{settings.HOST}:{settings.PORT}/admin/onboarding-verifications")  # NEW
+    
+    # Prefetch GA4 credentials/token so the first analytics request doesn't pay for it
+    try:
+        from app.services.analytics_service import warmup as warmup_ga4
+        await warmup_ga4()
+    except ImportError as e:
+        print(f"⚠️ GA4 warmup skipped: {e}")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Actions to perform on application shutdown"""
     print(f"🛑 {settings.APP_NAME} is shutting down...")
+    
+    try:
+        from app.utils.http_client import close_aiohttp_session
+        await close_aiohttp_session()
+    except ImportError:
+        pass
 
 
 if __name__ == "__main__":
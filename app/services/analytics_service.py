@@ -6,25 +6,256 @@ Fetches real analytics data from GA4 using service account authentication
 
 import os
 import json
+import asyncio
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
+from typing import Callable, Dict, Iterator, List, Any, Optional, Set, Tuple
+import numpy as np
+from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient, BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
+    BatchRunReportsRequest,
     RunReportRequest,
     DateRange,
     Dimension,
     Metric,
     OrderBy
 )
+from google.api_core import exceptions as google_exceptions
 from google.oauth2 import service_account
 
+from app.utils.resilience import CircuitBreaker, async_call_with_retry, call_with_retry
+
 logger = logging.getLogger(__name__)
 
+_GA4_DATE_FORMAT = "%04d-%02d-%02d"
+
+# Rows requested per run_report page when paginating large reports
+GA4_PAGE_SIZE = 10000
+
+# Report batching: how long to wait for concurrent requests to coalesce,
+# the most reports GA4 accepts per batchRunReports call, and the maximum
+# number of batches in flight (GA4 concurrent-request quota)
+GA4_BATCH_WINDOW = 0.02
+GA4_MAX_BATCH_SIZE = 5
+GA4_MAX_CONCURRENT_BATCHES = 10
+
+# Shared by every GA4 caller so an outage short-circuits all of them
+ga4_circuit_breaker = CircuitBreaker("GA4")
+
+
+def is_transient_ga4_error(exc: Exception) -> bool:
+    """Return True for GA4 errors that are worth retrying"""
+    return isinstance(exc, (
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.InternalServerError
+    ))
+
+
+def _format_ga4_date(date_str: str) -> str:
+    """Convert a GA4 YYYYMMDD date dimension to YYYY-MM-DD"""
+    year, month_day = divmod(int(date_str), 10000)
+    return _GA4_DATE_FORMAT % (year, *divmod(month_day, 100))
+
+
+def parse_metric_values(rows, metric_count: int) -> np.ndarray:
+    """
+    Convert the metric values of GA4 report rows into a float64 matrix
+    
+    Empty values become 0. Callers slice out columns and cast them with
+    astype() rather than converting each cell individually.
+    """
+    values = [mv.value or '0' for row in rows for mv in row.metric_values]
+    return np.array(values, dtype=np.float64).reshape(-1, metric_count)
+
+
+def columns_to_rows(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Convert columnar daily data into the list of per-day dicts returned to callers"""
+    keys = list(columns)
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+
+@lru_cache(maxsize=4)
+def _load_credentials(credentials_path: str) -> service_account.Credentials:
+    """Parse a service account file once; the credentials object is loop-independent"""
+    return service_account.Credentials.from_service_account_file(
+        credentials_path,
+        scopes=['https://www.googleapis.com/auth/analytics.readonly']
+    )
+
+
+@lru_cache(maxsize=4)
+def get_analytics_client(credentials_path: str) -> BetaAnalyticsDataClient:
+    """
+    Return a shared GA4 client for the given service account file
+    
+    The gRPC client is thread-safe, so one channel per credentials file is
+    reused across service instances instead of reconnecting each time.
+    """
+    return BetaAnalyticsDataClient(credentials=_load_credentials(credentials_path))
+
+
+# grpc.aio channels and asyncio primitives belong to the event loop they were
+# created on, so async clients and batchers are kept per running loop
+_loop_resources: Dict[asyncio.AbstractEventLoop, Dict[Tuple[str, str], Any]] = {}
+
+
+def _get_loop_resource(kind: str, credentials_path: str, factory: Callable[[], Any]) -> Any:
+    """Return the ``kind`` resource for credentials_path on the running loop, creating it once"""
+    loop = asyncio.get_running_loop()
+    resources = _loop_resources.get(loop)
+    if resources is None:
+        # Forget loops that have been closed (e.g. one per test or per asyncio.run)
+        for closed in [other for other in _loop_resources if other.is_closed()]:
+            del _loop_resources[closed]
+        resources = _loop_resources[loop] = {}
+    
+    key = (kind, credentials_path)
+    if key not in resources:
+        resources[key] = factory()
+    return resources[key]
+
+
+def get_async_analytics_client(credentials_path: str) -> BetaAnalyticsDataAsyncClient:
+    """Return the grpc.aio-based GA4 client for the running loop and service account file"""
+    return _get_loop_resource(
+        "client",
+        credentials_path,
+        lambda: BetaAnalyticsDataAsyncClient(credentials=_load_credentials(credentials_path))
+    )
+
+
+class ReportBatcher:
+    """
+    Coalesces concurrent run_report calls into batchRunReports requests
+    
+    Requests for the same property that arrive within GA4_BATCH_WINDOW of
+    each other are sent as one batch (up to GA4_MAX_BATCH_SIZE), and each
+    caller gets its own report back. A batcher must only be used on the
+    event loop it was created on (see get_report_batcher).
+    """
+    
+    def __init__(self, client: BetaAnalyticsDataAsyncClient):
+        self._client = client
+        self._pending: Dict[str, List[Tuple[RunReportRequest, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._semaphore = asyncio.Semaphore(GA4_MAX_CONCURRENT_BATCHES)
+    
+    async def run_report(self, request: RunReportRequest):
+        """Queue a report request and wait for its result from the next batch"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        queue = self._pending.setdefault(request.property, [])
+        queue.append((request, future))
+        
+        if len(queue) >= GA4_MAX_BATCH_SIZE:
+            self._flush(request.property)
+        elif len(queue) == 1:
+            self._timers[request.property] = loop.call_later(
+                GA4_BATCH_WINDOW, self._flush, request.property
+            )
+        
+        return await future
+    
+    def _flush(self, property_name: str):
+        # A size-triggered flush must not leave the window timer armed, or
+        # it would flush the property's next queue early
+        timer = self._timers.pop(property_name, None)
+        if timer is not None:
+            timer.cancel()
+        
+        queue = self._pending.pop(property_name, None)
+        if queue:
+            # Keep a reference so the task isn't garbage-collected mid-flight
+            task = asyncio.ensure_future(self._dispatch(property_name, queue))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _dispatch(
+        self,
+        property_name: str,
+        queue: List[Tuple[RunReportRequest, asyncio.Future]]
+    ):
+        error: Optional[Exception] = None
+        try:
+            async with self._semaphore:
+                response = await self._client.batch_run_reports(
+                    BatchRunReportsRequest(
+                        property=property_name,
+                        requests=[request for request, _ in queue]
+                    )
+                )
+            
+            for (_, future), report in zip(queue, response.reports):
+                if not future.done():
+                    future.set_result(report)
+        except asyncio.CancelledError:
+            for _, future in queue:
+                future.cancel()
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            # Whatever happened (error, short response, cancellation), no
+            # caller may be left waiting on its future
+            for _, future in queue:
+                if not future.done():
+                    future.set_exception(error or RuntimeError(
+                        f"GA4 batch for {property_name} returned no report for this request"
+                    ))
+
+
+def get_report_batcher(credentials_path: str) -> ReportBatcher:
+    """Return the report batcher for the running loop and service account file"""
+    return _get_loop_resource(
+        "batcher",
+        credentials_path,
+        lambda: ReportBatcher(get_async_analytics_client(credentials_path))
+    )
 
 class GoogleAnalyticsService:
     """Service for fetching data from Google Analytics 4"""
     
+    # Report definitions are constant; build the protobuf messages once and
+    # only vary the property and date range per request
+    _DAILY_DIMENSIONS = [Dimension(name="date")]
+    _DAILY_METRICS = [
+        Metric(name="sessions"),
+        Metric(name="totalUsers"),
+        Metric(name="newUsers"),
+        Metric(name="screenPageViews"),
+        Metric(name="bounceRate"),
+        Metric(name="averageSessionDuration"),
+        Metric(name="conversions"),
+        Metric(name="engagedSessions")
+    ]
+    _DAILY_ORDER_BYS = [OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="date"))]
+    
+    _SOURCE_DIMENSIONS = [Dimension(name="sessionDefaultChannelGroup")]
+    _SOURCE_METRICS = [
+        Metric(name="sessions"),
+        Metric(name="totalUsers"),
+        Metric(name="conversions")
+    ]
+    _SOURCE_ORDER_BYS = [OrderBy(
+        metric=OrderBy.MetricOrderBy(metric_name="sessions"),
+        desc=True
+    )]
+    
+    _PAGE_DIMENSIONS = [Dimension(name="pagePath")]
+    _PAGE_METRICS = [
+        Metric(name="screenPageViews"),
+        Metric(name="averageSessionDuration"),
+        Metric(name="bounceRate")
+    ]
+    _PAGE_ORDER_BYS = [OrderBy(
+        metric=OrderBy.MetricOrderBy(metric_name="screenPageViews"),
+        desc=True
+    )]
+    
     def __init__(self, credentials_path: str = None, property_id: str = None):
         """
         Initialize GA4 service with credentials
@@ -45,17 +276,13 @@ class GoogleAnalyticsService:
         """Initialize the GA4 API client with service account credentials"""
         try:
             if os.path.exists(self.credentials_path):
-                credentials = service_account.Credentials.from_service_account_file(
-                    self.credentials_path,
-                    scopes=['https://www.googleapis.com/auth/analytics.readonly']
-                )
-                self.client = BetaAnalyticsDataClient(credentials=credentials)
+                self.client = get_analytics_client(self.credentials_path)
                 logger.info("GA4 client initialized successfully")
             else:
-                logger.warning(f"GA4 credentials file not found: {self.credentials_path}")
+                logger.warning("GA4 credentials file not found: %s", self.credentials_path)
                 self.client = None
-        except Exception as e:
-            logger.error(f"Failed to initialize GA4 client: {str(e)}")
+        except Exception:
+            logger.exception("Failed to initialize GA4 client")
             self.client = None
     
     def get_analytics_data(
@@ -78,13 +305,11 @@ class GoogleAnalyticsService:
         if not self.client:
             return self._get_empty_response("GA4 client not initialized")
         
-        property_id = property_id or self.property_id
+        if ga4_circuit_breaker.is_open:
+            return self._get_empty_response("GA4 temporarily unavailable (circuit open)")
         
-        # Default to last 30 days
-        if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
-        if not start_date:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        property_id = property_id or self.property_id
+        start_date, end_date = self._resolve_date_range(start_date, end_date)
         
         try:
             # Fetch daily metrics
@@ -96,76 +321,127 @@ class GoogleAnalyticsService:
             # Fetch top pages
             top_pages = self._fetch_top_pages(property_id, start_date, end_date)
             
-            # Calculate summary
-            summary = self._calculate_summary(daily_data)
-            
-            return {
-                "success": True,
-                "property_id": property_id,
-                "date_range": {
-                    "start_date": start_date,
-                    "end_date": end_date
-                },
-                "summary": summary,
-                "daily_data": daily_data,
-                "traffic_sources": traffic_sources,
-                "top_pages": top_pages
-            }
+            return self._build_response(
+                property_id, start_date, end_date, daily_data, traffic_sources, top_pages
+            )
             
         except Exception as e:
-            logger.error(f"Error fetching GA4 data: {str(e)}")
+            logger.exception("Error fetching GA4 data")
             return self._get_empty_response(str(e))
     
+    def _resolve_date_range(self, start_date: Optional[str], end_date: Optional[str]):
+        """Default to the last 30 days when dates are not provided"""
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        if not start_date:
+            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        return start_date, end_date
+    
+    def _build_response(
+        self,
+        property_id: str,
+        start_date: str,
+        end_date: str,
+        daily_data: Dict[str, Any],
+        traffic_sources: List[Dict[str, Any]],
+        top_pages: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Assemble the get_analytics_data payload"""
+        return {
+            "success": True,
+            "property_id": property_id,
+            "date_range": {
+                "start_date": start_date,
+                "end_date": end_date
+            },
+            "summary": self._calculate_summary(daily_data),
+            "daily_data": columns_to_rows({
+                name: column if isinstance(column, list) else column.tolist()
+                for name, column in daily_data.items()
+            }),
+            "traffic_sources": traffic_sources,
+            "top_pages": top_pages
+        }
+    
+    def _run_report(self, request: RunReportRequest):
+        """Run a GA4 report, retrying transient errors behind the circuit breaker"""
+        return call_with_retry(
+            lambda: self.client.run_report(request),
+            breaker=ga4_circuit_breaker,
+            retry_if=is_transient_ga4_error
+        )
+    
+    def _iter_report_rows(
+        self,
+        request: RunReportRequest,
+        page_size: int = GA4_PAGE_SIZE
+    ) -> Iterator[Any]:
+        """
+        Yield report rows page by page using offset/limit pagination
+        
+        Only one page of rows is held at a time, and reports longer than a
+        single page are no longer truncated at the API's default limit.
+        """
+        offset = 0
+        request.limit = page_size
+        while True:
+            request.offset = offset
+            response = self._run_report(request)
+            yield from response.rows
+            if len(response.rows) < page_size:
+                break
+            offset += page_size
+    
     def _fetch_daily_metrics(
         self, 
         property_id: str, 
         start_date: str, 
         end_date: str
-    ) -> List[Dict[str, Any]]:
-        """Fetch daily metrics from GA4"""
+    ) -> Dict[str, Any]:
+        """Fetch daily metrics from GA4 as one column per metric"""
         try:
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-                dimensions=[Dimension(name="date")],
-                metrics=[
-                    Metric(name="sessions"),
-                    Metric(name="totalUsers"),
-                    Metric(name="newUsers"),
-                    Metric(name="screenPageViews"),
-                    Metric(name="bounceRate"),
-                    Metric(name="averageSessionDuration"),
-                    Metric(name="conversions"),
-                    Metric(name="engagedSessions")
-                ],
-                order_bys=[OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="date"))]
-            )
-            
-            response = self.client.run_report(request)
-            
-            daily_data = []
-            for row in response.rows:
-                date_str = row.dimension_values[0].value
-                # Convert YYYYMMDD to YYYY-MM-DD
-                formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                
-                daily_data.append({
-                    "date": formatted_date,
-                    "sessions": int(row.metric_values[0].value or 0),
-                    "users": int(row.metric_values[1].value or 0),
-                    "new_users": int(row.metric_values[2].value or 0),
-                    "page_views": int(row.metric_values[3].value or 0),
-                    "bounce_rate": round(float(row.metric_values[4].value or 0) * 100, 2),
-                    "avg_session_duration": round(float(row.metric_values[5].value or 0), 2),
-                    "conversions": int(row.metric_values[6].value or 0),
-                    "engaged_sessions": int(row.metric_values[7].value or 0)
-                })
+            request = self._daily_metrics_request(property_id, start_date, end_date)
+            return self._build_daily_columns(self._iter_report_rows(request))
             
-            return daily_data
-            
-        except Exception as e:
-            logger.error(f"Error fetching daily metrics: {str(e)}")
-            return []
+        except Exception:
+            logger.exception("Error fetching daily metrics")
+            return self._build_daily_columns([])
+    
+    def _daily_metrics_request(
+        self,
+        property_id: str,
+        start_date: str,
+        end_date: str
+    ) -> RunReportRequest:
+        return RunReportRequest(
+            property=f"properties/{property_id}",
+            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+            dimensions=self._DAILY_DIMENSIONS,
+            metrics=self._DAILY_METRICS,
+            order_bys=self._DAILY_ORDER_BYS
+        )
+    
+    def _build_daily_columns(self, rows) -> Dict[str, Any]:
+        """Build columnar daily data (dates list plus NumPy metric arrays)"""
+        # Single pass so rows can be consumed straight from the paginator
+        dates = []
+        values = []
+        for row in rows:
+            dates.append(_format_ga4_date(row.dimension_values[0].value))
+            values.extend(mv.value or '0' for mv in row.metric_values)
+        metrics = np.array(values, dtype=np.float64).reshape(-1, 8)
+        
+        return {
+            "date": dates,
+            "sessions": metrics[:, 0].astype(np.int64),
+            "users": metrics[:, 1].astype(np.int64),
+            "new_users": metrics[:, 2].astype(np.int64),
+            "page_views": metrics[:, 3].astype(np.int64),
+            "bounce_rate": np.round(metrics[:, 4] * 100, 2),
+            "avg_session_duration": np.round(metrics[:, 5], 2),
+            "conversions": metrics[:, 6].astype(np.int64),
+            "engaged_sessions": metrics[:, 7].astype(np.int64)
+        }
     
     def _fetch_traffic_sources(
         self, 
@@ -175,39 +451,40 @@ class GoogleAnalyticsService:
     ) -> List[Dict[str, Any]]:
         """Fetch traffic source breakdown"""
         try:
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-                dimensions=[Dimension(name="sessionDefaultChannelGroup")],
-                metrics=[
-                    Metric(name="sessions"),
-                    Metric(name="totalUsers"),
-                    Metric(name="conversions")
-                ],
-                order_bys=[OrderBy(
-                    metric=OrderBy.MetricOrderBy(metric_name="sessions"),
-                    desc=True
-                )],
-                limit=10
-            )
-            
-            response = self.client.run_report(request)
-            
-            sources = []
-            for row in response.rows:
-                sources.append({
-                    "channel": row.dimension_values[0].value,
-                    "sessions": int(row.metric_values[0].value or 0),
-                    "users": int(row.metric_values[1].value or 0),
-                    "conversions": int(row.metric_values[2].value or 0)
-                })
+            request = self._traffic_sources_request(property_id, start_date, end_date)
+            return self._parse_traffic_sources(self._run_report(request).rows)
             
-            return sources
-            
-        except Exception as e:
-            logger.error(f"Error fetching traffic sources: {str(e)}")
+        except Exception:
+            logger.exception("Error fetching traffic sources")
             return []
     
+    def _traffic_sources_request(
+        self,
+        property_id: str,
+        start_date: str,
+        end_date: str
+    ) -> RunReportRequest:
+        return RunReportRequest(
+            property=f"properties/{property_id}",
+            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+            dimensions=self._SOURCE_DIMENSIONS,
+            metrics=self._SOURCE_METRICS,
+            order_bys=self._SOURCE_ORDER_BYS,
+            limit=10
+        )
+    
+    def _parse_traffic_sources(self, rows) -> List[Dict[str, Any]]:
+        sources = []
+        for row in rows:
+            sources.append({
+                "channel": row.dimension_values[0].value,
+                "sessions": int(row.metric_values[0].value or 0),
+                "users": int(row.metric_values[1].value or 0),
+                "conversions": int(row.metric_values[2].value or 0)
+            })
+        
+        return sources
+    
     def _fetch_top_pages(
         self, 
         property_id: str, 
@@ -216,42 +493,53 @@ class GoogleAnalyticsService:
     ) -> List[Dict[str, Any]]:
         """Fetch top performing pages"""
         try:
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-                dimensions=[Dimension(name="pagePath")],
-                metrics=[
-                    Metric(name="screenPageViews"),
-                    Metric(name="averageSessionDuration"),
-                    Metric(name="bounceRate")
-                ],
-                order_bys=[OrderBy(
-                    metric=OrderBy.MetricOrderBy(metric_name="screenPageViews"),
-                    desc=True
-                )],
-                limit=10
-            )
+            request = self._top_pages_request(property_id, start_date, end_date)
+            return self._parse_top_pages(self._run_report(request).rows)
             
-            response = self.client.run_report(request)
-            
-            pages = []
-            for row in response.rows:
-                pages.append({
-                    "page_path": row.dimension_values[0].value,
-                    "page_views": int(row.metric_values[0].value or 0),
-                    "avg_time_on_page": round(float(row.metric_values[1].value or 0), 2),
-                    "bounce_rate": round(float(row.metric_values[2].value or 0) * 100, 2)
-                })
-            
-            return pages
-            
-        except Exception as e:
-            logger.error(f"Error fetching top pages: {str(e)}")
+        except Exception:
+            logger.exception("Error fetching top pages")
             return []
     
-    def _calculate_summary(self, daily_data: List[Dict]) -> Dict[str, Any]:
-        """Calculate summary metrics from daily data"""
-        if not daily_data:
+    def _top_pages_request(
+        self,
+        property_id: str,
+        start_date: str,
+        end_date: str
+    ) -> RunReportRequest:
+        return RunReportRequest(
+            property=f"properties/{property_id}",
+            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+            dimensions=self._PAGE_DIMENSIONS,
+            metrics=self._PAGE_METRICS,
+            order_bys=self._PAGE_ORDER_BYS,
+            limit=10
+        )
+    
+    def _parse_top_pages(self, rows) -> List[Dict[str, Any]]:
+        pages = []
+        for row in rows:
+            pages.append({
+                "page_path": row.dimension_values[0].value,
+                "page_views": int(row.metric_values[0].value or 0),
+                "avg_time_on_page": round(float(row.metric_values[1].value or 0), 2),
+                "bounce_rate": round(float(row.metric_values[2].value or 0) * 100, 2)
+            })
+        
+        return pages
+    
+    def _calculate_summary(
+        self,
+        daily_data: Dict[str, Any],
+        weighted: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Calculate summary metrics from columnar daily data
+        
+        Bounce rate and session duration are averaged weighted by each day's
+        sessions, so low-traffic days don't skew them. Pass weighted=False
+        for the plain mean of the daily values.
+        """
+        if not daily_data["date"]:
             return {
                 "total_sessions": 0,
                 "total_users": 0,
@@ -261,20 +549,19 @@ class GoogleAnalyticsService:
                 "total_conversions": 0
             }
         
-        total_sessions = sum(d['sessions'] for d in daily_data)
-        total_users = sum(d['users'] for d in daily_data)
-        total_page_views = sum(d['page_views'] for d in daily_data)
-        total_conversions = sum(d['conversions'] for d in daily_data)
-        avg_bounce_rate = sum(d['bounce_rate'] for d in daily_data) / len(daily_data)
-        avg_session_duration = sum(d['avg_session_duration'] for d in daily_data) / len(daily_data)
+        sessions = daily_data["sessions"]
+        total_sessions = int(sessions.sum())
+        weights = sessions if weighted and total_sessions else None
         
         return {
             "total_sessions": total_sessions,
-            "total_users": total_users,
-            "total_page_views": total_page_views,
-            "avg_bounce_rate": round(avg_bounce_rate, 2),
-            "avg_session_duration": round(avg_session_duration, 2),
-            "total_conversions": total_conversions
+            "total_users": int(daily_data["users"].sum()),
+            "total_page_views": int(daily_data["page_views"].sum()),
+            "avg_bounce_rate": round(float(np.average(daily_data["bounce_rate"], weights=weights)), 2),
+            "avg_session_duration": round(
+                float(np.average(daily_data["avg_session_duration"], weights=weights)), 2
+            ),
+            "total_conversions": int(daily_data["conversions"].sum())
         }
     
     def _get_empty_response(self, error_message: str = None) -> Dict[str, Any]:
@@ -296,8 +583,170 @@ class GoogleAnalyticsService:
         }
 
 
+class AsyncGoogleAnalyticsService(GoogleAnalyticsService):
+    """
+    GA4 service built on the grpc.aio client
+    
+    The three reports behind get_analytics_data run concurrently on the
+    event loop instead of one after another on a blocked worker.
+    """
+    
+    def _initialize_client(self):
+        """
+        Load the service account credentials
+        
+        The grpc.aio client and report batcher are bound to an event loop,
+        so they are looked up per running loop in _run_report; here only the
+        (loop-independent) credentials are loaded, which also validates them.
+        """
+        try:
+            if os.path.exists(self.credentials_path):
+                self.credentials = _load_credentials(self.credentials_path)
+                logger.info("GA4 async credentials loaded successfully")
+            else:
+                logger.warning("GA4 credentials file not found: %s", self.credentials_path)
+                self.credentials = None
+        except Exception:
+            logger.exception("Failed to initialize GA4 async client")
+            self.credentials = None
+    
+    async def get_analytics_data(
+        self,
+        property_id: str = None,
+        start_date: str = None,
+        end_date: str = None
+    ) -> Dict[str, Any]:
+        """Async version of GoogleAnalyticsService.get_analytics_data"""
+        if not self.credentials:
+            return self._get_empty_response("GA4 client not initialized")
+        
+        if ga4_circuit_breaker.is_open:
+            return self._get_empty_response("GA4 temporarily unavailable (circuit open)")
+        
+        property_id = property_id or self.property_id
+        start_date, end_date = self._resolve_date_range(start_date, end_date)
+        
+        try:
+            daily_data, traffic_sources, top_pages = await asyncio.gather(
+                self._fetch_daily_metrics(property_id, start_date, end_date),
+                self._fetch_traffic_sources(property_id, start_date, end_date),
+                self._fetch_top_pages(property_id, start_date, end_date)
+            )
+            
+            return self._build_response(
+                property_id, start_date, end_date, daily_data, traffic_sources, top_pages
+            )
+            
+        except Exception as e:
+            logger.exception("Error fetching GA4 data")
+            return self._get_empty_response(str(e))
+    
+    async def _run_report(self, request: RunReportRequest):
+        """
+        Run a GA4 report through the shared batcher, retrying transient
+        errors behind the circuit breaker
+        """
+        batcher = get_report_batcher(self.credentials_path)
+        return await async_call_with_retry(
+            lambda: batcher.run_report(request),
+            breaker=ga4_circuit_breaker,
+            retry_if=is_transient_ga4_error
+        )
+    
+    async def _fetch_daily_metrics(
+        self,
+        property_id: str,
+        start_date: str,
+        end_date: str
+    ) -> Dict[str, Any]:
+        """Fetch daily metrics from GA4 as one column per metric"""
+        try:
+            request = self._daily_metrics_request(property_id, start_date, end_date)
+            request.limit = GA4_PAGE_SIZE
+            
+            rows = []
+            offset = 0
+            while True:
+                request.offset = offset
+                response = await self._run_report(request)
+                rows.extend(response.rows)
+                if len(response.rows) < GA4_PAGE_SIZE:
+                    break
+                offset += GA4_PAGE_SIZE
+            
+            return self._build_daily_columns(rows)
+            
+        except Exception:
+            logger.exception("Error fetching daily metrics")
+            return self._build_daily_columns([])
+    
+    async def _fetch_traffic_sources(
+        self,
+        property_id: str,
+        start_date: str,
+        end_date: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch traffic source breakdown"""
+        try:
+            request = self._traffic_sources_request(property_id, start_date, end_date)
+            response = await self._run_report(request)
+            return self._parse_traffic_sources(response.rows)
+            
+        except Exception:
+            logger.exception("Error fetching traffic sources")
+            return []
+    
+    async def _fetch_top_pages(
+        self,
+        property_id: str,
+        start_date: str,
+        end_date: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch top performing pages"""
+        try:
+            request = self._top_pages_request(property_id, start_date, end_date)
+            response = await self._run_report(request)
+            return self._parse_top_pages(response.rows)
+            
+        except Exception:
+            logger.exception("Error fetching top pages")
+            return []
+
+
 # Convenience function for quick access
 def get_ga4_data(start_date: str = None, end_date: str = None) -> Dict[str, Any]:
     """Quick function to get GA4 data with default settings"""
     service = GoogleAnalyticsService()
-    return service.get_analytics_data(start_date=start_date, end_date=end_date)
\ No newline at end of file
+    return service.get_analytics_data(start_date=start_date, end_date=end_date)
+
+
+async def get_ga4_data_async(start_date: str = None, end_date: str = None) -> Dict[str, Any]:
+    """Async counterpart of get_ga4_data"""
+    service = AsyncGoogleAnalyticsService()
+    return await service.get_analytics_data(start_date=start_date, end_date=end_date)
+
+
+async def warmup() -> None:
+    """
+    Pre-load GA4 credentials and the OAuth access token at process start
+    
+    Issues one trivial report so the key parsing, JWT signing, token exchange
+    and channel setup happen before the first user request instead of on it.
+    """
+    service = GoogleAnalyticsService()
+    if not service.client:
+        return
+    
+    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    request = RunReportRequest(
+        property=f"properties/{service.property_id}",
+        date_ranges=[DateRange(start_date=yesterday, end_date=yesterday)],
+        metrics=[Metric(name="sessions")],
+        limit=1
+    )
+    
+    try:
+        await asyncio.to_thread(service.client.run_report, request, timeout=10)
+        logger.info("GA4 client warmed up")
+    except Exception as e:
+        logger.warning("GA4 warmup failed: %s", e)
\ No newline at end of file
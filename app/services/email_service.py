@@ -3,9 +3,51 @@ Email Service Integration (Mailchimp)
 File: app/services/email_service.py
 """
 
+import asyncio
+import logging
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Any, Optional
 from app.core.config import settings
+from app.utils.resilience import CircuitBreaker, async_call_with_retry, is_transient_http_error
+
+logger = logging.getLogger(__name__)
+
+
+# Maximum number of in-flight Mandrill requests during a bulk send
+BULK_SEND_CONCURRENCY = 20
+
+# Maximum recipients Mandrill accepts in a single messages/send call
+MANDRILL_MAX_RECIPIENTS = 1000
+
+# (connect, read) timeout for Mandrill and Marketing API requests
+MAILCHIMP_TIMEOUT = (3.05, 30)
+
+# One breaker per upstream so a Mandrill outage doesn't block the Marketing API
+_mandrill_breaker = CircuitBreaker("Mandrill")
+_mailchimp_breaker = CircuitBreaker("Mailchimp")
+
+# Process-wide HTTP session so TCP/TLS connections are kept alive between
+# calls. Retries are handled by EmailService._request, not the adapter.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+
+
+def _is_retryable_post_error(exc: Exception) -> bool:
+    """
+    Failures safe to retry for a non-idempotent POST
+
+    Only connection errors and 429s, where the upstream did not act on the
+    request; a timeout or 5xx may follow an email or campaign already sent.
+    """
+    if isinstance(exc, requests.ConnectionError):
+        return True
+    return (
+        isinstance(exc, requests.HTTPError)
+        and exc.response is not None
+        and exc.response.status_code == 429
+    )
 
 
 class EmailService:
@@ -26,6 +68,38 @@ class EmailService:
             self.api_key = settings.MAILCHIMP_API_KEY
             self.server_prefix = settings.MAILCHIMP_SERVER_PREFIX
             self.base_url = f"https://{self.server_prefix}.api.mailchimp.com/3.0"
+            self.auth_headers = {"Authorization": f"Bearer {self.api_key}"}
+    
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        breaker: CircuitBreaker,
+        **kwargs
+    ) -> requests.Response:
+        """
+        Perform an HTTP request in a worker thread, retrying transient failures
+        
+        POSTs (sends, campaign creation) are only retried when the request
+        never reached the upstream or was rate limited. Raises
+        CircuitOpenError without touching the network while the upstream's
+        breaker is open.
+        """
+        kwargs.setdefault("timeout", MAILCHIMP_TIMEOUT)
+        
+        def _send() -> requests.Response:
+            response = _session.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        
+        return await async_call_with_retry(
+            lambda: asyncio.to_thread(_send),
+            breaker=breaker,
+            retry_if=(
+                _is_retryable_post_error if method.upper() == "POST"
+                else is_transient_http_error
+            )
+        )
     
     # =====================================================
     # MAILCHIMP METHODS
@@ -73,10 +147,10 @@ class EmailService:
                 }
             }
             
-            response = requests.post(url, json=payload)
-            response.raise_for_status()
+            # Runs in a worker thread so bulk sends can overlap
+            response = await self._request("POST", url, _mandrill_breaker, json=payload)
             
-            result = response.json()[0]
+            result = orjson.loads(response.content)[0]
             
             return {
                 "success": result["status"] in ["sent", "queued"],
@@ -86,13 +160,107 @@ class EmailService:
             }
         
         except Exception as e:
-            print(f"Mailchimp Error for {to_email}: {e}")
+            logger.exception("Mailchimp error for %s", to_email)
             return {
                 "success": False,
                 "error": str(e),
                 "recipient": to_email
             }
     
+    async def send_bulk_mailchimp(
+        self,
+        recipients: List[str],
+        subject: str,
+        html_content: str,
+        from_email: str = "noreply@panveliq.com",
+        from_name: str = "PanvelIQ"
+    ) -> List[Dict[str, Any]]:
+        """
+        Send one transactional email to many recipients in a single Mandrill call
+        
+        Args:
+            recipients: Recipient emails (at most MANDRILL_MAX_RECIPIENTS)
+            subject: Email subject
+            html_content: HTML email content
+            from_email: Sender email
+            from_name: Sender name
+            
+        Returns:
+            Per-recipient results in the same shape as send_email_mailchimp
+        """
+        try:
+            url = "https://mandrillapp.com/api/1.0/messages/send"
+            
+            payload = {
+                "key": self.api_key,
+                "message": {
+                    "html": html_content,
+                    "subject": subject,
+                    "from_email": from_email,
+                    "from_name": from_name,
+                    "to": [
+                        {
+                            "email": recipient,
+                            "type": "to"
+                        }
+                        for recipient in recipients
+                    ],
+                    # Each recipient gets their own copy without seeing the others
+                    "preserve_recipients": False,
+                    # Per-recipient slots for handlebars personalization; bulk
+                    # sends have no per-recipient data yet
+                    "merge_language": "handlebars",
+                    "merge_vars": [
+                        {
+                            "rcpt": recipient,
+                            "vars": []
+                        }
+                        for recipient in recipients
+                    ],
+                    "track_opens": True,
+                    "track_clicks": True
+                }
+            }
+            
+            response = await self._request("POST", url, _mandrill_breaker, json=payload)
+            
+            # Mandrill may echo addresses with different casing
+            statuses = {
+                (item.get("email") or "").strip().lower(): item
+                for item in orjson.loads(response.content)
+            }
+            
+            results = []
+            for recipient in recipients:
+                item = statuses.get(recipient.strip().lower())
+                if item is None:
+                    results.append({
+                        "success": False,
+                        "error": "No status returned by Mailchimp",
+                        "recipient": recipient
+                    })
+                    continue
+                
+                results.append({
+                    "success": item["status"] in ["sent", "queued"],
+                    "status": item["status"],
+                    "message_id": item.get("_id"),
+                    "recipient": recipient
+                })
+            
+            return results
+        
+        except Exception as e:
+            logger.exception("Mailchimp bulk send error for %d recipients", len(recipients))
+            return [
+                {
+                    "success": False,
+                    "error": str(e),
+                    "recipient": recipient
+                }
+                for recipient in recipients
+            ]
+    
     async def create_mailchimp_campaign(
         self,
         list_id: str,
@@ -117,11 +285,6 @@ class EmailService:
         try:
             url = f"{self.base_url}/campaigns"
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "type": "regular",
                 "recipients": {
@@ -135,9 +298,10 @@ class EmailService:
             }
             
             # Create campaign
-            response = requests.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            campaign = response.json()
+            response = await self._request(
+                "POST", url, _mailchimp_breaker, headers=self.auth_headers, json=payload
+            )
+            campaign = orjson.loads(response.content)
             campaign_id = campaign["id"]
             
             # Set campaign content
@@ -146,8 +310,9 @@ class EmailService:
                 "html": html_content
             }
             
-            content_response = requests.put(content_url, headers=headers, json=content_payload)
-            content_response.raise_for_status()
+            await self._request(
+                "PUT", content_url, _mailchimp_breaker, headers=self.auth_headers, json=content_payload
+            )
             
             return {
                 "success": True,
@@ -156,7 +321,7 @@ class EmailService:
             }
         
         except Exception as e:
-            print(f"Mailchimp Campaign Creation Error: {e}")
+            logger.exception("Mailchimp campaign creation error")
             return {
                 "success": False,
                 "error": str(e)
@@ -175,12 +340,7 @@ class EmailService:
         try:
             url = f"{self.base_url}/campaigns/{campaign_id}/actions/send"
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
-            response = requests.post(url, headers=headers)
-            response.raise_for_status()
+            await self._request("POST", url, _mailchimp_breaker, headers=self.auth_headers)
             
             return {
                 "success": True,
@@ -189,7 +349,7 @@ class EmailService:
             }
         
         except Exception as e:
-            print(f"Mailchimp Campaign Send Error: {e}")
+            logger.exception("Mailchimp campaign send error for %s", campaign_id)
             return {
                 "success": False,
                 "error": str(e)
@@ -215,11 +375,6 @@ class EmailService:
         try:
             url = f"{self.base_url}/lists/{list_id}/members"
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "email_address": email,
                 "status": "subscribed"
@@ -228,17 +383,18 @@ class EmailService:
             if merge_fields:
                 payload["merge_fields"] = merge_fields
             
-            response = requests.post(url, headers=headers, json=payload)
-            response.raise_for_status()
+            response = await self._request(
+                "POST", url, _mailchimp_breaker, headers=self.auth_headers, json=payload
+            )
             
             return {
                 "success": True,
-                "subscriber_id": response.json().get("id"),
+                "subscriber_id": orjson.loads(response.content).get("id"),
                 "email": email
             }
         
         except Exception as e:
-            print(f"Mailchimp Add Subscriber Error: {e}")
+            logger.exception("Mailchimp add subscriber error for %s", email)
             return {
                 "success": False,
                 "error": str(e),
@@ -258,31 +414,28 @@ class EmailService:
         try:
             url = f"{self.base_url}/reports/{campaign_id}"
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
+            response = await self._request("GET", url, _mailchimp_breaker, headers=self.auth_headers)
             
-            report = response.json()
+            report = orjson.loads(response.content)
+            opens = report.get("opens") or {}
+            clicks = report.get("clicks") or {}
             
             return {
                 "success": True,
                 "campaign_id": campaign_id,
                 "stats": {
                     "emails_sent": report.get("emails_sent", 0),
-                    "opens": report.get("opens", {}).get("opens_total", 0),
-                    "unique_opens": report.get("opens", {}).get("unique_opens", 0),
-                    "open_rate": report.get("opens", {}).get("open_rate", 0),
-                    "clicks": report.get("clicks", {}).get("clicks_total", 0),
-                    "unique_clicks": report.get("clicks", {}).get("unique_clicks", 0),
-                    "click_rate": report.get("clicks", {}).get("click_rate", 0)
+                    "opens": opens.get("opens_total", 0),
+                    "unique_opens": opens.get("unique_opens", 0),
+                    "open_rate": opens.get("open_rate", 0),
+                    "clicks": clicks.get("clicks_total", 0),
+                    "unique_clicks": clicks.get("unique_clicks", 0),
+                    "click_rate": clicks.get("click_rate", 0)
                 }
             }
         
         except Exception as e:
-            print(f"Mailchimp Reports Error: {e}")
+            logger.exception("Mailchimp reports error for %s", campaign_id)
             return {
                 "success": False,
                 "error": str(e)
@@ -345,7 +498,46 @@ class EmailService:
             Summary of sent emails
         """
         if self.provider == "mailchimp":
-            # For Mailchimp, send individually
+            if len(recipients) == 1:
+                details = [
+                    await self.send_email_mailchimp(
+                        to_email=recipients[0],
+                        subject=subject,
+                        html_content=html_content,
+                        from_email=from_email,
+                        from_name=from_name
+                    )
+                ]
+            else:
+                # Batch recipients into multi-recipient Mandrill calls,
+                # sending the batches with bounded concurrency
+                semaphore = asyncio.Semaphore(BULK_SEND_CONCURRENCY)
+                batches = [
+                    recipients[i:i + MANDRILL_MAX_RECIPIENTS]
+                    for i in range(0, len(recipients), MANDRILL_MAX_RECIPIENTS)
+                ]
+                
+                async def _send_batch(batch: List[str]) -> List[Dict[str, Any]]:
+                    async with semaphore:
+                        return await self.send_bulk_mailchimp(
+                            recipients=batch,
+                            subject=subject,
+                            html_content=html_content,
+                            from_email=from_email,
+                            from_name=from_name
+                        )
+                
+                batch_results = await asyncio.gather(
+                    *[_send_batch(batch) for batch in batches],
+                    return_exceptions=True
+                )
+                
+                details = []
+                for batch, batch_result in zip(batches, batch_results):
+                    if isinstance(batch_result, Exception):
+                        batch_result = [batch_result] * len(batch)
+                    details.extend(batch_result)
+            
             results = {
                 "total": len(recipients),
                 "successful": 0,
@@ -353,14 +545,13 @@ class EmailService:
                 "details": []
             }
             
-            for recipient in recipients:
-                result = await self.send_email_mailchimp(
-                    to_email=recipient,
-                    subject=subject,
-                    html_content=html_content,
-                    from_email=from_email,
-                    from_name=from_name
-                )
+            for recipient, result in zip(recipients, details):
+                if isinstance(result, Exception):
+                    result = {
+                        "success": False,
+                        "error": str(result),
+                        "recipient": recipient
+                    }
                 
                 if result["success"]:
                     results["successful"] += 1
@@ -3,22 +3,45 @@ Google Analytics 4 API Service
 File: app/services/ga4_service.py
 """
 
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
     DateRange,
     Dimension,
     Metric,
     RunReportRequest,
 )
-from google.oauth2 import service_account
 from datetime import date, timedelta
+import asyncio
 from typing import Dict, Any
 import json
+import logging
+import numpy as np
 
 from app.core.config import settings
+from app.services.analytics_service import (
+    get_analytics_client,
+    ga4_circuit_breaker,
+    is_transient_ga4_error,
+    parse_metric_values,
+)
+from app.utils.resilience import async_call_with_retry
+
+logger = logging.getLogger(__name__)
 
 
 class GA4Service:
+    # Constant report definition, built once instead of per request
+    _DIMENSIONS = [
+        Dimension(name="date"),
+    ]
+    _METRICS = [
+        Metric(name="screenPageViews"),
+        Metric(name="totalUsers"),
+        Metric(name="newUsers"),
+        Metric(name="bounceRate"),
+        Metric(name="averageSessionDuration"),
+        Metric(name="conversions"),
+    ]
+    
     def __init__(self):
         self.property_id = settings.GA4_PROPERTY_ID
         self.credentials_path = settings.GA4_CREDENTIALS_JSON
@@ -26,12 +49,9 @@ class GA4Service:
         
         if self.credentials_path:
             try:
-                credentials = service_account.Credentials.from_service_account_file(
-                    self.credentials_path
-                )
-                self.client = BetaAnalyticsDataClient(credentials=credentials)
-            except Exception as e:
-                print(f"GA4 initialization error: {e}")
+                self.client = get_analytics_client(self.credentials_path)
+            except Exception:
+                logger.exception("GA4 initialization error")
     
     async def get_metrics(
         self,
@@ -51,43 +71,43 @@ class GA4Service:
                     start_date=start_date.isoformat(),
                     end_date=end_date.isoformat()
                 )],
-                dimensions=[
-                    Dimension(name="date"),
-                ],
-                metrics=[
-                    Metric(name="screenPageViews"),
-                    Metric(name="totalUsers"),
-                    Metric(name="newUsers"),
-                    Metric(name="bounceRate"),
-                    Metric(name="averageSessionDuration"),
-                    Metric(name="conversions"),
-                ],
+                dimensions=self._DIMENSIONS,
+                metrics=self._METRICS,
             )
             
-            response = self.client.run_report(request)
+            # run_report is a blocking gRPC call; keep it off the event loop
+            response = await async_call_with_retry(
+                lambda: asyncio.to_thread(self.client.run_report, request),
+                breaker=ga4_circuit_breaker,
+                retry_if=is_transient_ga4_error
+            )
             
             return self._parse_response(response)
             
-        except Exception as e:
-            print(f"GA4 API error: {e}")
+        except Exception:
+            logger.exception("GA4 API error")
             return self._get_mock_data()
     
     def _parse_response(self, response) -> Dict[str, Any]:
         """Parse GA4 API response"""
-        metrics_data = []
+        rows = response.rows
+        metrics = parse_metric_values(rows, 6)
+        counts = metrics[:, [0, 1, 2, 5]].astype(np.int64).tolist()
+        rates = metrics[:, [3, 4]].tolist()
         
-        for row in response.rows:
-            date_val = row.dimension_values[0].value
-            metrics = row.metric_values
+        metrics_data = []
+        for row, count, rate in zip(rows, counts, rates):
+            page_views, unique_visitors, new_users, conversion_events = count
+            bounce_rate, avg_session_duration = rate
             
             metrics_data.append({
-                "metric_date": date_val,
-                "page_views": int(metrics[0].value) if metrics[0].value else 0,
-                "unique_visitors": int(metrics[1].value) if metrics[1].value else 0,
-                "new_users": int(metrics[2].value) if metrics[2].value else 0,
-                "bounce_rate": float(metrics[3].value) if metrics[3].value else 0.0,
-                "avg_session_duration": float(metrics[4].value) if metrics[4].value else 0.0,
-                "conversion_events": int(metrics[5].value) if metrics[5].value else 0,
+                "metric_date": row.dimension_values[0].value,
+                "page_views": page_views,
+                "unique_visitors": unique_visitors,
+                "new_users": new_users,
+                "bounce_rate": bounce_rate,
+                "avg_session_duration": avg_session_duration,
+                "conversion_events": conversion_events,
             })
         
         return {
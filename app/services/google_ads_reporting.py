@@ -5,14 +5,146 @@ File: app/services/google_ads_reporting.py
 Replace your existing google_ads_reporting.py with this version
 """
 
+import asyncio
+import aiohttp
+import ijson
+import orjson
 import requests
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import string
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
 import logging
+import numpy as np
+import pandas as pd
 
 from app.core.config import settings
+from app.utils.http_client import get_aiohttp_session
+from app.utils.resilience import CircuitBreaker
+from app.utils.report_cache import (
+    get_cached_report,
+    get_cached_report_async,
+    report_cache_ttl,
+    set_cached_report,
+    set_cached_report_async
+)
 
 logger = logging.getLogger(__name__)
 
+# Shared across service instances (which are created per request) so
+# connections to the Google Ads and OAuth endpoints are kept alive between report calls
+# searchStream queries and token refreshes are safe to repeat, so POSTs are
+# retried on 429/5xx; the last failed response still reaches raise_for_status
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False
+    )
+))
+
+# ijson prefix of each result row in a searchStream response
+# (a JSON array of {"results": [...]} batches)
+SEARCH_STREAM_ROWS = 'item.results.item'
+
+# Refresh access tokens this many seconds before Google says they expire
+TOKEN_EXPIRY_MARGIN = 300
+
+# Access tokens keyed by refresh token: (token, monotonic expiry time).
+# Module-level because the service is instantiated per request.
+_token_cache: Dict[str, Tuple[str, float]] = {}
+_token_lock = threading.Lock()
+
+# After repeated token failures skip OAuth for a while instead of making
+# every report request wait on a degraded endpoint
+_oauth_breaker = CircuitBreaker("Google Ads OAuth", fail_max=3, reset_timeout=60)
+OAUTH_TIMEOUT = 10
+
+_CAMPAIGN_QUERY_TMPL = string.Template("""
+    SELECT 
+        campaign.id,
+        campaign.name,
+        campaign.status,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.conversions,
+        metrics.cost_micros,
+        metrics.ctr,
+        metrics.average_cpc,
+        metrics.conversions_value,
+        segments.date
+    FROM campaign
+    WHERE segments.date BETWEEN '$start_date' AND '$end_date'
+    $campaign_filter
+""")
+
+_DAILY_QUERY_TMPL = string.Template("""
+    SELECT 
+        segments.date,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.conversions,
+        metrics.cost_micros,
+        metrics.conversions_value
+    FROM campaign
+    WHERE segments.date BETWEEN '$start_date' AND '$end_date'
+""")
+
+
+def _validate_date(value: str) -> str:
+    """Ensure a date is YYYY-MM-DD before it is placed in a GAQL query"""
+    datetime.strptime(value, '%Y-%m-%d')
+    return value
+
+
+_CAMPAIGN_METRIC_COLUMNS = [
+    'metrics.impressions',
+    'metrics.clicks',
+    'metrics.conversions',
+    'metrics.costMicros',
+    'metrics.ctr',
+    'metrics.averageCpc',
+    'metrics.conversionsValue'
+]
+
+_DAILY_METRIC_COLUMNS = [
+    'metrics.impressions',
+    'metrics.clicks',
+    'metrics.conversions',
+    'metrics.costMicros',
+    'metrics.conversionsValue'
+]
+
+_SUMMARY_FIELDS = ('cost', 'impressions', 'clicks', 'conversions', 'conversions_value')
+
+
+def _metrics_frame(results: List[Dict], columns: List[str]) -> pd.DataFrame:
+    """
+    Flatten searchStream result rows and convert the metric columns to float64
+    
+    Google Ads omits zero-valued metrics and returns int64 fields as JSON
+    strings, so missing columns/values become 0 and the whole column is
+    converted in one astype() call.
+    """
+    df = pd.json_normalize(results)
+    df[columns] = df.reindex(columns=columns).fillna(0).astype(np.float64)
+    return df
+
+
+def _object_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return a non-metric column with missing values as None"""
+    if column not in df:
+        return pd.Series([None] * len(df), index=df.index, dtype=object)
+    return df[column].astype(object).where(df[column].notna(), None)
+
 
 class GoogleAdsReportingService:
     """Google Ads reporting using direct REST API calls - No SDK required"""
@@ -24,27 +156,128 @@ class GoogleAdsReportingService:
         self.refresh_token = settings.GOOGLE_ADS_REFRESH_TOKEN
         self.customer_id = settings.GOOGLE_ADS_CUSTOMER_ID
         self.base_url = "https://googleads.googleapis.com/v16"
+        self._session = _session
+        
+        customer_id_formatted = (self.customer_id or '').replace('-', '')
+        self._search_url = f"{self.base_url}/customers/{customer_id_formatted}/googleAds:searchStream"
+        
+        self._oauth_payload = {
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'refresh_token': self.refresh_token,
+            'grant_type': 'refresh_token'
+        }
+        # Google APIs only gzip responses when the User-Agent also says "gzip"
+        self._base_headers = {
+            'developer-token': self.developer_token,
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip',
+            'User-Agent': 'panvel-iq (gzip)'
+        }
         
     
-    def _get_access_token(self) -> Optional[str]:
-        """Get OAuth access token from refresh token"""
-        try:
-            url = "https://oauth2.googleapis.com/token"
-            data = {
-                'client_id': self.client_id,
-                'client_secret': self.client_secret,
-                'refresh_token': self.refresh_token,
-                'grant_type': 'refresh_token'
-            }
-            
-            response = requests.post(url, data=data, timeout=30)
-            response.raise_for_status()
+    def _get_access_token(self, force_refresh: bool = False) -> Optional[str]:
+        """
+        Get OAuth access token from refresh token
+        
+        Tokens are cached until shortly before they expire (~1 hour), so
+        report calls don't pay for a token exchange every time. The lock
+        makes concurrent callers wait for a single refresh. After three
+        failed refreshes in a row, None is returned immediately for a minute.
+        """
+        with _token_lock:
+            cached = _token_cache.get(self.refresh_token)
+            if cached and not force_refresh and time.monotonic() < cached[1] - TOKEN_EXPIRY_MARGIN:
+                return cached[0]
             
-            return response.json().get('access_token')
+            if _oauth_breaker.is_open:
+                logger.warning("Google Ads OAuth circuit open, skipping token refresh")
+                return None
             
-        except Exception as e:
-            logger.error(f"Failed to get Google Ads access token: {str(e)}")
-            return None
+            try:
+                url = "https://oauth2.googleapis.com/token"
+                response = self._session.post(url, data=self._oauth_payload, timeout=OAUTH_TIMEOUT)
+                response.raise_for_status()
+                
+                token_data = orjson.loads(response.content)
+                access_token = token_data.get('access_token')
+                if access_token:
+                    expires_in = int(token_data.get('expires_in', 3600))
+                    _token_cache[self.refresh_token] = (access_token, time.monotonic() + expires_in)
+                    _oauth_breaker.record_success()
+                else:
+                    _oauth_breaker.record_failure()
+                
+                return access_token
+                
+            except Exception as e:
+                _oauth_breaker.record_failure()
+                logger.error(f"Failed to get Google Ads access token: {str(e)}")
+                return None
+    
+    def _headers(self, access_token: str) -> Dict[str, str]:
+        return {**self._base_headers, 'Authorization': f'Bearer {access_token}'}
+    
+    def _search_stream(self, access_token: str, query: str) -> List[Dict]:
+        """
+        Run a GAQL query against googleAds:searchStream and return its result rows
+        
+        searchStream answers with a JSON array of {"results": [...]} batches.
+        The body is parsed incrementally as it arrives, so only the rows are
+        held in memory, never the raw response.
+        
+        On 401 the cached token is treated as revoked: it is refreshed once
+        and the query retried.
+        """
+        url = self._search_url
+        body = orjson.dumps({'query': query})
+        
+        response = self._session.post(
+            url, data=body, headers=self._headers(access_token), stream=True, timeout=30
+        )
+        if response.status_code == 401:
+            response.close()
+            access_token = self._get_access_token(force_refresh=True)
+            if access_token:
+                response = self._session.post(
+                    url, data=body, headers=self._headers(access_token), stream=True, timeout=30
+                )
+        
+        with response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return list(ijson.items(response.raw, SEARCH_STREAM_ROWS, use_float=True))
+    
+    async def _search_stream_async(self, access_token: str, query: str) -> List[Dict]:
+        """Async version of _search_stream using the shared aiohttp session"""
+        session = get_aiohttp_session()
+        url = self._search_url
+        body = orjson.dumps({'query': query})
+        timeout = aiohttp.ClientTimeout(total=30)
+        
+        async with session.post(
+            url, data=body, headers=self._headers(access_token), timeout=timeout
+        ) as response:
+            if response.status != 401:
+                response.raise_for_status()
+                return [
+                    row async for row in
+                    ijson.items(response.content, SEARCH_STREAM_ROWS, use_float=True)
+                ]
+        
+        access_token = await asyncio.to_thread(self._get_access_token, True)
+        if not access_token:
+            raise RuntimeError("Google Ads access token refresh failed")
+        
+        async with session.post(
+            url, data=body, headers=self._headers(access_token), timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            return [
+                row async for row in
+                ijson.items(response.content, SEARCH_STREAM_ROWS, use_float=True)
+            ]
     
     
     def get_campaign_performance(
@@ -61,69 +294,151 @@ class GoogleAdsReportingService:
             end_date: YYYY-MM-DD
             campaign_id: Optional specific campaign
         """
+        return self.get_campaigns_performance(
+            start_date, end_date, [campaign_id] if campaign_id else None
+        )
+    
+    def get_campaigns_performance(
+        self,
+        start_date: str,
+        end_date: str,
+        campaign_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch performance for several campaigns with a single GAQL query
+        
+        Args:
+            start_date: YYYY-MM-DD
+            end_date: YYYY-MM-DD
+            campaign_ids: Campaigns to include (all campaigns when empty)
+        """
         if not all([self.developer_token, self.client_id, self.customer_id]):
             logger.error("Google Ads credentials not configured")
             return self._get_empty_response()
         
+        campaign_ids = sorted(set(campaign_ids or []))
+        cache_key = self._report_cache_key(start_date, end_date, campaign_ids)
+        cached = get_cached_report(cache_key)
+        if cached:
+            return cached
+        
         access_token = self._get_access_token()
         if not access_token:
             return self._get_empty_response()
         
         try:
-            customer_id_formatted = self.customer_id.replace('-', '')
-            url = f"{self.base_url}/customers/{customer_id_formatted}/googleAds:searchStream"
-            
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'developer-token': self.developer_token,
-                'Content-Type': 'application/json'
-            }
-            
-            # Build query
-            campaign_filter = f"AND campaign.id = {campaign_id}" if campaign_id else ""
-            
-            query = f"""
-                SELECT 
-                    campaign.id,
-                    campaign.name,
-                    campaign.status,
-                    metrics.impressions,
-                    metrics.clicks,
-                    metrics.conversions,
-                    metrics.cost_micros,
-                    metrics.ctr,
-                    metrics.average_cpc,
-                    metrics.conversions_value,
-                    segments.date
-                FROM campaign
-                WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
-                {campaign_filter}
-            """
-            
-            payload = {'query': query}
-            
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
+            query = self._campaign_query(start_date, end_date, campaign_ids)
+            results = self._search_stream(access_token, query)
+            report = self._build_performance_response(results, start_date, end_date)
+            set_cached_report(cache_key, report, report_cache_ttl(end_date))
+            return report
             
-            data = response.json()
-            campaigns = self._process_response(data)
-            summary = self._calculate_summary(campaigns)
-            
-            return {
-                'success': True,
-                'platform': 'google_ads',
-                'date_range': {
-                    'start_date': start_date,
-                    'end_date': end_date
-                },
-                'summary': summary,
-                'campaigns': campaigns
-            }
+        except Exception as e:
+            logger.error(f"Google Ads API error: {str(e)}")
+            return self._get_empty_response()
+    
+    async def get_campaign_performance_async(
+        self,
+        start_date: str,
+        end_date: str,
+        campaign_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of get_campaign_performance
+        
+        Doesn't block the event loop, so it can be awaited alongside other
+        platforms' reports with asyncio.gather.
+        """
+        return await self.get_campaigns_performance_async(
+            start_date, end_date, [campaign_id] if campaign_id else None
+        )
+    
+    async def get_campaigns_performance_async(
+        self,
+        start_date: str,
+        end_date: str,
+        campaign_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Async version of get_campaigns_performance"""
+        if not all([self.developer_token, self.client_id, self.customer_id]):
+            logger.error("Google Ads credentials not configured")
+            return self._get_empty_response()
+        
+        campaign_ids = sorted(set(campaign_ids or []))
+        cache_key = self._report_cache_key(start_date, end_date, campaign_ids)
+        cached = await get_cached_report_async(cache_key)
+        if cached:
+            return cached
+        
+        # Usually served from the token cache; a refresh runs in a worker thread
+        access_token = await asyncio.to_thread(self._get_access_token)
+        if not access_token:
+            return self._get_empty_response()
+        
+        try:
+            query = self._campaign_query(start_date, end_date, campaign_ids)
+            results = await self._search_stream_async(access_token, query)
+            report = self._build_performance_response(results, start_date, end_date)
+            await set_cached_report_async(cache_key, report, report_cache_ttl(end_date))
+            return report
             
         except Exception as e:
             logger.error(f"Google Ads API error: {str(e)}")
             return self._get_empty_response()
     
+    def _report_cache_key(
+        self,
+        start_date: str,
+        end_date: str,
+        campaign_ids: List[str]
+    ) -> str:
+        campaigns = ','.join(campaign_ids) or '*'
+        return f"gads:{self.customer_id}:{start_date}:{end_date}:{campaigns}"
+    
+    def _campaign_query(
+        self,
+        start_date: str,
+        end_date: str,
+        campaign_ids: List[str]
+    ) -> str:
+        """Build the campaign performance GAQL query"""
+        for campaign_id in campaign_ids:
+            if not campaign_id.isdigit():
+                raise ValueError(f"Invalid Google Ads campaign id: {campaign_id!r}")
+        
+        if len(campaign_ids) == 1:
+            campaign_filter = f"AND campaign.id = {campaign_ids[0]}"
+        elif campaign_ids:
+            campaign_filter = f"AND campaign.id IN ({', '.join(campaign_ids)})"
+        else:
+            campaign_filter = ""
+        
+        return _CAMPAIGN_QUERY_TMPL.substitute(
+            start_date=_validate_date(start_date),
+            end_date=_validate_date(end_date),
+            campaign_filter=campaign_filter
+        )
+    
+    def _build_performance_response(
+        self,
+        results: List[Dict],
+        start_date: str,
+        end_date: str
+    ) -> Dict[str, Any]:
+        campaigns = self._process_response(results)
+        summary = self._calculate_summary(campaigns)
+        
+        return {
+            'success': True,
+            'platform': 'google_ads',
+            'date_range': {
+                'start_date': start_date,
+                'end_date': end_date
+            },
+            'summary': summary,
+            'campaigns': campaigns
+        }
+    
     
     def get_daily_metrics(
         self,
@@ -136,116 +451,90 @@ class GoogleAdsReportingService:
             return []
         
         try:
-            customer_id_formatted = self.customer_id.replace('-', '')
-            url = f"{self.base_url}/customers/{customer_id_formatted}/googleAds:searchStream"
+            query = _DAILY_QUERY_TMPL.substitute(
+                start_date=_validate_date(start_date),
+                end_date=_validate_date(end_date)
+            )
             
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'developer-token': self.developer_token,
-                'Content-Type': 'application/json'
-            }
-            
-            query = f"""
-                SELECT 
-                    segments.date,
-                    metrics.impressions,
-                    metrics.clicks,
-                    metrics.conversions,
-                    metrics.cost_micros,
-                    metrics.conversions_value
-                FROM campaign
-                WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
-            """
-            
-            payload = {'query': query}
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            return self._process_daily_data(data)
+            results = self._search_stream(access_token, query)
+            return self._process_daily_data(results)
             
         except Exception as e:
             logger.error(f"Error fetching daily Google Ads metrics: {str(e)}")
             return []
     
     
-    def _process_response(self, data: Dict) -> List[Dict[str, Any]]:
-        """Process API response into campaign list"""
-        campaigns = []
+    def _process_response(self, results: List[Dict]) -> List[Dict[str, Any]]:
+        """Process searchStream result rows into campaign list"""
+        if not results:
+            return []
         
-        for result in data.get('results', []):
-            campaign = result.get('campaign', {})
-            metrics = result.get('metrics', {})
-            
-            campaigns.append({
-                'campaign_id': campaign.get('id'),
-                'campaign_name': campaign.get('name'),
-                'status': campaign.get('status'),
-                'impressions': int(metrics.get('impressions', 0)),
-                'clicks': int(metrics.get('clicks', 0)),
-                'conversions': float(metrics.get('conversions', 0)),
-                'cost': float(metrics.get('costMicros', 0)) / 1_000_000,
-                'ctr': float(metrics.get('ctr', 0)) * 100,
-                'avg_cpc': float(metrics.get('averageCpc', 0)) / 1_000_000,
-                'conversions_value': float(metrics.get('conversionsValue', 0))
-            })
-        
-        return campaigns
+        df = _metrics_frame(results, _CAMPAIGN_METRIC_COLUMNS)
+        
+        campaigns = pd.DataFrame({
+            'campaign_id': _object_column(df, 'campaign.id'),
+            'campaign_name': _object_column(df, 'campaign.name'),
+            'status': _object_column(df, 'campaign.status'),
+            'impressions': df['metrics.impressions'].astype(np.int64),
+            'clicks': df['metrics.clicks'].astype(np.int64),
+            'conversions': df['metrics.conversions'],
+            'cost': df['metrics.costMicros'] / 1_000_000,
+            'ctr': df['metrics.ctr'] * 100,
+            'avg_cpc': df['metrics.averageCpc'] / 1_000_000,
+            'conversions_value': df['metrics.conversionsValue']
+        })
+        
+        return campaigns.to_dict(orient='records')
     
     
-    def _process_daily_data(self, data: Dict) -> List[Dict[str, Any]]:
-        """Process daily metrics from API response"""
-        daily_metrics = {}
+    def _process_daily_data(self, results: List[Dict]) -> List[Dict[str, Any]]:
+        """Process daily metrics from searchStream result rows"""
+        if not results:
+            return []
         
-        for result in data.get('results', []):
-            date = result.get('segments', {}).get('date')
-            metrics = result.get('metrics', {})
-            
-            if date not in daily_metrics:
-                daily_metrics[date] = {
-                    'date': date,
-                    'impressions': 0,
-                    'clicks': 0,
-                    'conversions': 0,
-                    'cost': 0,
-                    'conversions_value': 0
-                }
-            
-            daily_metrics[date]['impressions'] += int(metrics.get('impressions', 0))
-            daily_metrics[date]['clicks'] += int(metrics.get('clicks', 0))
-            daily_metrics[date]['conversions'] += float(metrics.get('conversions', 0))
-            daily_metrics[date]['cost'] += float(metrics.get('costMicros', 0)) / 1_000_000
-            daily_metrics[date]['conversions_value'] += float(metrics.get('conversionsValue', 0))
+        df = _metrics_frame(results, _DAILY_METRIC_COLUMNS)
+        df['date'] = _object_column(df, 'segments.date')
+        
+        # Sum every campaign's metrics per day (sorted by date)
+        daily = df.groupby('date')[_DAILY_METRIC_COLUMNS].sum()
+        impressions = daily['metrics.impressions']
+        clicks = daily['metrics.clicks']
+        conversions = daily['metrics.conversions']
+        cost = daily['metrics.costMicros'] / 1_000_000
+        value = daily['metrics.conversionsValue']
         
         # Calculate rates
-        result = []
-        for date, day_data in sorted(daily_metrics.items()):
-            ctr = (day_data['clicks'] / day_data['impressions'] * 100) if day_data['impressions'] > 0 else 0
-            conv_rate = (day_data['conversions'] / day_data['clicks'] * 100) if day_data['clicks'] > 0 else 0
-            roas = (day_data['conversions_value'] / day_data['cost']) if day_data['cost'] > 0 else 0
-            
-            result.append({
-                'date': date,
-                'impressions': day_data['impressions'],
-                'clicks': day_data['clicks'],
-                'conversions': int(day_data['conversions']),
-                'cost': round(day_data['cost'], 2),
-                'conversions_value': round(day_data['conversions_value'], 2),
-                'ctr': round(ctr, 2),
-                'conversion_rate': round(conv_rate, 2),
-                'roas': round(roas, 2)
-            })
-        
-        return result
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ctr = np.where(impressions > 0, clicks / impressions * 100, 0)
+            conv_rate = np.where(clicks > 0, conversions / clicks * 100, 0)
+            roas = np.where(cost > 0, value / cost, 0)
+        
+        result = pd.DataFrame({
+            'date': daily.index,
+            'impressions': impressions.astype(np.int64).to_numpy(),
+            'clicks': clicks.astype(np.int64).to_numpy(),
+            'conversions': conversions.astype(np.int64).to_numpy(),
+            'cost': cost.round(2).to_numpy(),
+            'conversions_value': value.round(2).to_numpy(),
+            'ctr': np.round(ctr, 2),
+            'conversion_rate': np.round(conv_rate, 2),
+            'roas': np.round(roas, 2)
+        })
+        
+        return result.to_dict(orient='records')
     
     
     def _calculate_summary(self, campaigns: List[Dict]) -> Dict[str, Any]:
         """Calculate summary metrics"""
-        total_cost = sum(c.get('cost', 0) for c in campaigns)
-        total_impressions = sum(c.get('impressions', 0) for c in campaigns)
-        total_clicks = sum(c.get('clicks', 0) for c in campaigns)
-        total_conversions = sum(c.get('conversions', 0) for c in campaigns)
-        total_value = sum(c.get('conversions_value', 0) for c in campaigns)
+        # One (n, 5) array and a single column-wise reduction instead of
+        # walking the campaign list once per metric
+        totals = np.array(
+            [[c.get(field, 0) for field in _SUMMARY_FIELDS] for c in campaigns],
+            dtype=np.float64
+        ).reshape(-1, len(_SUMMARY_FIELDS)).sum(axis=0)
+        total_cost, total_impressions, total_clicks, total_conversions, total_value = totals.tolist()
+        total_impressions = int(total_impressions)
+        total_clicks = int(total_clicks)
         
         avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
         conv_rate = (total_conversions / total_clicks * 100) if total_clicks > 0 else 0
@@ -5,56 +5,230 @@ File: app/services/moz_api_service.py
 Fetches SEO metrics including Domain Authority, Page Authority, backlinks, etc.
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+from functools import lru_cache
+from types import MappingProxyType
+from urllib.parse import urlsplit, urlunsplit
+from typing import Dict, List, Optional, Any, Tuple, Union
 import requests
-import hashlib
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hmac
 import base64
+import threading
 import time
 import logging
+import numpy as np
+import orjson
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared across service instances (which are created per request) so the
+# TLS connection to lsapi.seomoz.com is kept alive between Moz calls
+# The Moz endpoints are read-only queries sent as POST, so POSTs are retried
+# on 429/5xx; the last failed response still reaches raise_for_status
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False
+    )
+))
+_session.headers.update({"Content-Type": "application/json"})
+
+# Signed auth headers are valid for AUTH_TTL seconds; reuse one until it is
+# within AUTH_REFRESH_MARGIN seconds of expiring
+AUTH_TTL = 300
+AUTH_REFRESH_MARGIN = 30
+
+# Auth headers keyed by access id: (header, expiry timestamp).
+# Module-level because the service is instantiated per request.
+_auth_cache: Dict[str, Tuple[str, int]] = {}
+_auth_lock = threading.Lock()
+
+# Moz url_metrics accepts up to 50 targets per request
+URL_METRICS_MAX_TARGETS = 50
+
+# Successful Moz responses and keyword analyses keyed by (kind, target):
+# (expiry, data). The same URL/domain/keyword is often requested by several
+# dashboard calls in a row.
+RESPONSE_CACHE_TTL = 300
+KEYWORD_CACHE_TTL = 86400
+RESPONSE_CACHE_MAXSIZE = 1024
+_response_cache: Dict[Tuple[str, Any], Tuple[float, Dict[str, Any]]] = {}
+_response_cache_lock = threading.Lock()
+
+# Keyword estimates are a heuristic task; the small model is far cheaper and faster
+KEYWORD_ANALYSIS_MODEL = "gpt-4o-mini"
+KEYWORD_BATCH_CONCURRENCY = 10
+
+
+def _cache_get(key: Tuple[str, Any]) -> Optional[Dict[str, Any]]:
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+    return None
+
+
+def _cache_put(key: Tuple[str, Any], value: Dict[str, Any], ttl: float) -> None:
+    now = time.monotonic()
+    with _response_cache_lock:
+        if len(_response_cache) >= RESPONSE_CACHE_MAXSIZE:
+            for stale in [k for k, (expires, _) in _response_cache.items() if expires <= now]:
+                del _response_cache[stale]
+            if len(_response_cache) >= RESPONSE_CACHE_MAXSIZE:
+                del _response_cache[next(iter(_response_cache))]
+        _response_cache[key] = (now + ttl, value)
+
+# Read-only templates for the failure responses; copied and completed per call
+_EMPTY_URL_METRICS = MappingProxyType({
+    'success': False,
+    'url': None,
+    'domain_authority': 0,
+    'page_authority': 0,
+    'spam_score': 0,
+    'root_domains_to_page': 0,
+    'external_pages_to_page': 0
+})
+
+_EMPTY_DOMAIN_METRICS = MappingProxyType({
+    'success': False,
+    'domain': None,
+    'domain_authority': 0,
+    'spam_score': 0,
+    'root_domains_linking': 0,
+    'total_backlinks': 0
+})
+
+_EMPTY_BACKLINK_METRICS = MappingProxyType({
+    'success': False,
+    'url': None,
+    'total_backlinks': 0,
+    'unique_domains': 0,
+    'backlinks': None
+})
+
+_EMPTY_KEYWORD_METRICS = MappingProxyType({
+    'success': False,
+    'keyword': None,
+    'search_volume': 0,
+    'difficulty': 0,
+    'organic_ctr': 0,
+    'priority': 0,
+    'cpc': 0,
+    'error': 'No data available'
+})
+
+
+@lru_cache(maxsize=1)
+def _get_openai_client():
+    """Shared OpenAI client (keeps its HTTP connection pool between calls)"""
+    from openai import OpenAI
+    return OpenAI(api_key=settings.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _get_async_openai_client():
+    """Shared async OpenAI client for batched keyword analysis"""
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+
 
 class MozAPIService:
     """Service for fetching SEO metrics from Moz API"""
     
+    __slots__ = (
+        'access_id',
+        'secret_key',
+        '_secret_bytes',
+        '_session',
+        '_access_prefix'
+    )
+    
+    # Fixed for every instance, so built once with the class
+    base_url = "https://lsapi.seomoz.com/v2"
+    _endpoints = MappingProxyType({
+        'url_metrics': f"{base_url}/url_metrics",
+        'anchor_text': f"{base_url}/anchor_text",
+        'top_pages': f"{base_url}/top_pages"
+    })
+    
     def __init__(self):
         """Initialize Moz API credentials"""
         self.access_id = settings.MOZ_ACCESS_ID
         self.secret_key = settings.MOZ_SECRET_KEY
-        self.base_url = "https://lsapi.seomoz.com/v2"
+        self._secret_bytes = (self.secret_key or '').encode('utf-8')
+        self._session = _session
+        self._access_prefix = f"{self.access_id}:".encode('utf-8')
         
     
     def _generate_auth_header(self) -> str:
         """
         Generate authentication header for Moz API
         
+        The signed header stays valid for 5 minutes, so it is cached and
+        only re-signed shortly before it expires.
+        
         Returns:
             Base64 encoded authentication string
         """
-        # Current timestamp
-        expires = int(time.time()) + 300  # 5 minutes from now
-        
-        # Create string to sign
-        string_to_sign = f"{self.access_id}\n{expires}"
-        
-        # Generate HMAC signature
-        binary_signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            string_to_sign.encode('utf-8'),
-            hashlib.sha1
-        ).digest()
+        with _auth_lock:
+            now = int(time.time())
+            cached = _auth_cache.get(self.access_id)
+            if cached and cached[1] - now > AUTH_REFRESH_MARGIN:
+                return cached[0]
+            
+            expires = now + AUTH_TTL
+            
+            # Create string to sign
+            string_to_sign = f"{self.access_id}\n{expires}"
+            
+            # Generate HMAC signature
+            binary_signature = hmac.digest(
+                self._secret_bytes,
+                string_to_sign.encode('utf-8'),
+                'sha1'
+            )
+            
+            # Base64 encode the signature
+            signature = base64.b64encode(binary_signature)
+            
+            # Create authorization header
+            auth_header = "Basic " + base64.b64encode(self._access_prefix + signature).decode('ascii')
+            
+            _auth_cache[self.access_id] = (auth_header, expires)
+            return auth_header
+    
+    
+    def _post(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a Moz API request and return the decoded response
         
-        # Base64 encode the signature
-        signature = base64.b64encode(binary_signature).decode('utf-8')
+        Successful responses are cached for RESPONSE_CACHE_TTL seconds;
+        errors are raised and never cached.
+        """
+        body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        key = (endpoint, body)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
         
-        # Create authorization header
-        auth_header = f"Basic {base64.b64encode(f'{self.access_id}:{signature}'.encode()).decode()}"
+        response = self._session.post(
+            endpoint, data=body, headers={"Authorization": self._generate_auth_header()}, timeout=30
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
-        return auth_header
+        _cache_put(key, data, RESPONSE_CACHE_TTL)
+        return data
     
     
     def get_url_metrics(self, url: str) -> Dict[str, Any]:
@@ -67,48 +241,25 @@ class MozAPIService:
         Returns:
             Dictionary containing SEO metrics
         """
+        url = self._canonicalize(url)
+        endpoint = self._endpoints['url_metrics']
+        
+        payload = {
+            "targets": [url]
+        }
+        
         try:
-            endpoint = f"{self.base_url}/url_metrics"
-            
-            headers = {
-                "Authorization": self._generate_auth_header(),
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "targets": [url]
-            }
-            
-            response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('results') and len(data['results']) > 0:
-                result = data['results'][0]
-                
-                return {
-                    'success': True,
-                    'url': url,
-                    'domain_authority': result.get('domain_authority', 0),
-                    'page_authority': result.get('page_authority', 0),
-                    'spam_score': result.get('spam_score', 0),
-                    'root_domains_to_page': result.get('root_domains_to_page', 0),
-                    'root_domains_to_subdomain': result.get('root_domains_to_subdomain', 0),
-                    'external_pages_to_page': result.get('external_pages_to_page', 0),
-                    'external_pages_to_subdomain': result.get('external_pages_to_subdomain', 0),
-                    'deleted_pages_to_page': result.get('deleted_pages_to_page', 0),
-                    'last_crawled': result.get('last_crawled', None)
-                }
-            else:
-                return self._get_empty_url_metrics(url)
-                
+            data = self._post(endpoint, payload)
         except requests.exceptions.RequestException as e:
             logger.error(f"Moz API request error: {str(e)}")
             return self._get_empty_url_metrics(url)
-        except Exception as e:
-            logger.error(f"Error fetching Moz URL metrics: {str(e)}")
+        except ValueError as e:
+            logger.error(f"Invalid Moz URL metrics response: {str(e)}")
             return self._get_empty_url_metrics(url)
+        
+        if data.get('results'):
+            return self._parse_url_metrics(url, data['results'][0])
+        return self._get_empty_url_metrics(url)
     
     
     def get_backlink_metrics(self, url: str, limit: int = 50) -> Dict[str, Any]:
@@ -122,54 +273,92 @@ class MozAPIService:
         Returns:
             Dictionary containing backlink metrics
         """
+        endpoint = self._endpoints['anchor_text']
+        
+        payload = {
+            "target": url,
+            "scope": "page",
+            "limit": limit
+        }
+        
         try:
-            endpoint = f"{self.base_url}/anchor_text"
-            
-            headers = {
-                "Authorization": self._generate_auth_header(),
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "target": url,
-                "scope": "page",
-                "limit": limit
-            }
-            
-            response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            backlinks = []
-            total_backlinks = 0
-            
-            if data.get('results'):
-                for result in data['results']:
-                    backlinks.append({
-                        'anchor_text': result.get('anchor_text', ''),
-                        'external_pages': result.get('external_pages', 0),
-                        'external_root_domains': result.get('external_root_domains', 0)
-                    })
-                    total_backlinks += result.get('external_pages', 0)
+            data = self._post(endpoint, payload)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Error fetching Moz backlink metrics: {str(e)}")
+            return {**_EMPTY_BACKLINK_METRICS, 'url': url, 'backlinks': []}
+        
+        backlinks = []
+        total_backlinks = 0
+        
+        for result in data.get('results') or []:
+            backlinks.append({
+                'anchor_text': result.get('anchor_text', ''),
+                'external_pages': result.get('external_pages', 0),
+                'external_root_domains': result.get('external_root_domains', 0)
+            })
+            total_backlinks += result.get('external_pages', 0)
+        
+        return {
+            'success': True,
+            'url': url,
+            'total_backlinks': total_backlinks,
+            'unique_domains': len(backlinks),
+            'backlinks': backlinks
+        }
+    
+    
+    def get_url_metrics_batch(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get URL metrics for several URLs with a single Moz request
+        
+        Args:
+            urls: URLs to analyze (at most URL_METRICS_MAX_TARGETS)
             
-            return {
-                'success': True,
-                'url': url,
-                'total_backlinks': total_backlinks,
-                'unique_domains': len(backlinks),
-                'backlinks': backlinks
-            }
+        Returns:
+            List of URL metrics in the same order as urls
+        """
+        urls = [self._canonicalize(url) for url in urls]
+        results = self._url_metrics_batch(urls)
+        return [
+            self._parse_url_metrics(url, result) if result else self._get_empty_url_metrics(url)
+            for url, result in zip(urls, results)
+        ]
+    
+    
+    def get_domain_metrics_batch(self, domains: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get domain metrics for several domains with a single Moz request
+        
+        Args:
+            domains: Domains to analyze (at most URL_METRICS_MAX_TARGETS)
             
-        except Exception as e:
-            logger.error(f"Error fetching Moz backlink metrics: {str(e)}")
-            return {
-                'success': False,
-                'url': url,
-                'total_backlinks': 0,
-                'unique_domains': 0,
-                'backlinks': []
-            }
+        Returns:
+            List of domain metrics in the same order as domains
+        """
+        domains = [self._canonicalize(domain) for domain in domains]
+        results = self._url_metrics_batch(domains)
+        return [
+            self._parse_domain_metrics(domain, result) if result else self._get_empty_domain_metrics(domain)
+            for domain, result in zip(domains, results)
+        ]
+    
+    
+    def _url_metrics_batch(self, targets: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Post all targets to url_metrics at once; None for targets without a result"""
+        if len(targets) > URL_METRICS_MAX_TARGETS:
+            raise ValueError(f"Moz url_metrics accepts at most {URL_METRICS_MAX_TARGETS} targets")
+        if not targets:
+            return []
+        
+        try:
+            data = self._post(self._endpoints['url_metrics'], {"targets": targets})
+            results = data.get('results') or []
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Error fetching Moz URL metrics batch: {str(e)}")
+            results = []
+        
+        # Results come back in target order
+        return results + [None] * (len(targets) - len(results))
     
     
     def get_domain_metrics(self, domain: str) -> Dict[str, Any]:
@@ -182,46 +371,23 @@ class MozAPIService:
         Returns:
             Dictionary containing domain metrics
         """
+        domain = self._canonicalize(domain)
+        
+        endpoint = self._endpoints['url_metrics']
+        
+        payload = {
+            "targets": [domain]
+        }
+        
         try:
-            # Ensure domain has protocol
-            if not domain.startswith('http'):
-                domain = f"https://{domain}"
-            
-            endpoint = f"{self.base_url}/url_metrics"
-            
-            headers = {
-                "Authorization": self._generate_auth_header(),
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "targets": [domain]
-            }
-            
-            response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('results') and len(data['results']) > 0:
-                result = data['results'][0]
-                
-                return {
-                    'success': True,
-                    'domain': domain,
-                    'domain_authority': result.get('domain_authority', 0),
-                    'spam_score': result.get('spam_score', 0),
-                    'root_domains_linking': result.get('root_domains_to_root_domain', 0),
-                    'total_backlinks': result.get('external_pages_to_root_domain', 0),
-                    'ranking_keywords': result.get('pages', 0),
-                    'last_crawled': result.get('last_crawled', None)
-                }
-            else:
-                return self._get_empty_domain_metrics(domain)
-                
-        except Exception as e:
+            data = self._post(endpoint, payload)
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Error fetching Moz domain metrics: {str(e)}")
             return self._get_empty_domain_metrics(domain)
+        
+        if data.get('results'):
+            return self._parse_domain_metrics(domain, data['results'][0])
+        return self._get_empty_domain_metrics(domain)
     
     
     def get_top_pages(self, domain: str, limit: int = 10) -> List[Dict[str, Any]]:
@@ -235,52 +401,44 @@ class MozAPIService:
         Returns:
             List of top pages with metrics
         """
+        domain = self._canonicalize(domain)
+        
+        endpoint = self._endpoints['top_pages']
+        
+        payload = {
+            "target": domain,
+            "limit": limit
+        }
+        
         try:
-            # Ensure domain has protocol
-            if not domain.startswith('http'):
-                domain = f"https://{domain}"
-            
-            endpoint = f"{self.base_url}/top_pages"
-            
-            headers = {
-                "Authorization": self._generate_auth_header(),
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "target": domain,
-                "limit": limit
-            }
-            
-            response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            top_pages = []
-            if data.get('results'):
-                for page in data['results']:
-                    top_pages.append({
-                        'url': page.get('url', ''),
-                        'page_authority': page.get('page_authority', 0),
-                        'external_links': page.get('external_pages_to_page', 0),
-                        'root_domains_linking': page.get('root_domains_to_page', 0),
-                        'spam_score': page.get('spam_score', 0)
-                    })
-            
-            return top_pages
-            
-        except Exception as e:
+            data = self._post(endpoint, payload)
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Error fetching top pages: {str(e)}")
             return []
+        
+        return [
+            {
+                'url': page.get('url', ''),
+                'page_authority': page.get('page_authority', 0),
+                'external_links': page.get('external_pages_to_page', 0),
+                'root_domains_linking': page.get('root_domains_to_page', 0),
+                'spam_score': page.get('spam_score', 0)
+            }
+            for page in data.get('results') or []
+        ]
     
     
-    def get_keyword_rankings(self, domain: str) -> Dict[str, Any]:
+    def get_keyword_rankings(
+        self,
+        domain: str,
+        domain_metrics: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Get keyword ranking overview for a domain
         
         Args:
             domain: The domain to analyze
+            domain_metrics: Already fetched get_domain_metrics() result, if any
             
         Returns:
             Dictionary containing keyword metrics
@@ -290,7 +448,8 @@ class MozAPIService:
             # This would require Moz Pro API or rank tracking integration
             # Returning basic structure for future implementation
             
-            domain_metrics = self.get_domain_metrics(domain)
+            if domain_metrics is None:
+                domain_metrics = self.get_domain_metrics(domain)
             
             return {
                 'success': True,
@@ -325,14 +484,24 @@ class MozAPIService:
             Comparison metrics
         """
         try:
-            # Get metrics for primary domain
-            primary_metrics = self.get_domain_metrics(domain)
+            # Skip duplicate competitors (after normalization), then limit to 5
+            competitor_domains = list(dict.fromkeys(
+                self._canonicalize(comp_domain) for comp_domain in competitor_domains
+            ))[:5]
+            
+            # One url_metrics request for primary and competitors
+            primary_metrics, *competitors = self.get_domain_metrics_batch(
+                [domain] + competitor_domains
+            )
             
-            # Get metrics for competitors
-            competitors = []
-            for comp_domain in competitor_domains[:5]:  # Limit to 5 competitors
-                comp_metrics = self.get_domain_metrics(comp_domain)
-                competitors.append(comp_metrics)
+            # Competitor numbers are meaningless without the primary domain's
+            if not primary_metrics.get('success'):
+                return {
+                    'success': False,
+                    'primary_domain': primary_metrics,
+                    'competitors': [],
+                    'error': 'primary domain lookup failed'
+                }
             
             return {
                 'success': True,
@@ -359,12 +528,17 @@ class MozAPIService:
             }
     
     
-    def _calculate_gap(self, primary_value: float, competitor_values: List[float]) -> Dict[str, Any]:
+    def _calculate_gap(
+        self,
+        primary_value: float,
+        competitor_values: Union[List[float], np.ndarray]
+    ) -> Dict[str, Any]:
         """Calculate gap between primary and competitor average"""
-        if not competitor_values:
+        values = np.asarray(competitor_values, dtype=np.float64)
+        if not values.size:
             return {'gap': 0, 'percentage': 0}
         
-        avg_competitor = sum(competitor_values) / len(competitor_values)
+        avg_competitor = float(values.mean())
         gap = primary_value - avg_competitor
         percentage = (gap / avg_competitor * 100) if avg_competitor > 0 else 0
         
@@ -375,29 +549,66 @@ class MozAPIService:
         }
     
     
-    def _get_empty_url_metrics(self, url: str) -> Dict[str, Any]:
-        """Return empty URL metrics structure"""
+    def _canonicalize(self, target: str) -> str:
+        """
+        Normalize a URL/domain so equivalent targets share one Moz request
+        
+        Adds https:// when there is no protocol, lowercases scheme and host,
+        drops default ports and a bare trailing slash.
+        """
+        target = target.strip()
+        if '://' not in target:
+            target = f"https://{target}"
+        
+        parts = urlsplit(target)
+        scheme = parts.scheme.lower()
+        netloc = parts.netloc.lower()
+        if (scheme, netloc.rpartition(':')[2]) in (('https', '443'), ('http', '80')):
+            netloc = netloc.rpartition(':')[0]
+        path = '' if parts.path == '/' else parts.path
+        
+        return urlunsplit((scheme, netloc, path, parts.query, parts.fragment))
+    
+    
+    def _parse_url_metrics(self, url: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build URL metrics from a url_metrics result"""
         return {
-            'success': False,
+            'success': True,
             'url': url,
-            'domain_authority': 0,
-            'page_authority': 0,
-            'spam_score': 0,
-            'root_domains_to_page': 0,
-            'external_pages_to_page': 0
+            'domain_authority': result.get('domain_authority', 0),
+            'page_authority': result.get('page_authority', 0),
+            'spam_score': result.get('spam_score', 0),
+            'root_domains_to_page': result.get('root_domains_to_page', 0),
+            'root_domains_to_subdomain': result.get('root_domains_to_subdomain', 0),
+            'external_pages_to_page': result.get('external_pages_to_page', 0),
+            'external_pages_to_subdomain': result.get('external_pages_to_subdomain', 0),
+            'deleted_pages_to_page': result.get('deleted_pages_to_page', 0),
+            'last_crawled': result.get('last_crawled', None)
         }
     
     
-    def _get_empty_domain_metrics(self, domain: str) -> Dict[str, Any]:
-        """Return empty domain metrics structure"""
+    def _parse_domain_metrics(self, domain: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build domain metrics from a url_metrics result"""
         return {
-            'success': False,
+            'success': True,
             'domain': domain,
-            'domain_authority': 0,
-            'spam_score': 0,
-            'root_domains_linking': 0,
-            'total_backlinks': 0
+            'domain_authority': result.get('domain_authority', 0),
+            'spam_score': result.get('spam_score', 0),
+            'root_domains_linking': result.get('root_domains_to_root_domain', 0),
+            'total_backlinks': result.get('external_pages_to_root_domain', 0),
+            'ranking_keywords': result.get('pages', 0),
+            'last_crawled': result.get('last_crawled', None)
         }
+    
+    
+    def _get_empty_url_metrics(self, url: str) -> Dict[str, Any]:
+        """Return empty URL metrics structure"""
+        return {**_EMPTY_URL_METRICS, 'url': url}
+    
+    
+    def _get_empty_domain_metrics(self, domain: str) -> Dict[str, Any]:
+        """Return empty domain metrics structure"""
+        return {**_EMPTY_DOMAIN_METRICS, 'domain': domain}
 
 
 
@@ -414,22 +625,83 @@ class MozAPIService:
         Returns:
             Dictionary containing estimated keyword metrics
         """
-        try:
-            from openai import OpenAI
-            from app.core.config import settings
-            
-            logger.info(f"📊 Analyzing keyword with AI: {keyword}")
-            
-            # Check if OpenAI is configured
-            if not settings.OPENAI_API_KEY:
-                logger.error("OpenAI API key not configured")
-                raise Exception("OpenAI API key required for keyword analysis")
-            
-            # Initialize OpenAI client
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        cache_key = ('keyword_difficulty', keyword.strip().lower())
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
+        logger.info(f"📊 Analyzing keyword with AI: {keyword}")
+        
+        # Check if OpenAI is configured
+        if not settings.OPENAI_API_KEY:
+            logger.error("OpenAI API key not configured")
+            raise ValueError("OpenAI API key required for keyword analysis")
+        
+        response = _get_openai_client().chat.completions.create(
+            **self._keyword_completion_args(keyword)
+        )
+        result = self._build_keyword_result(keyword, response.choices[0].message.content)
+        _cache_put(cache_key, result, KEYWORD_CACHE_TTL)
+        return dict(result)
+    
+    
+    async def get_keyword_difficulty_batch(self, keywords: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze several keywords concurrently with the async OpenAI client
+        
+        Cached and duplicate keywords are not sent again, and at most
+        KEYWORD_BATCH_CONCURRENCY requests are in flight at once. A keyword
+        whose analysis fails gets the empty keyword metrics.
+        
+        Args:
+            keywords: The keywords to analyze
             
-            # Use AI to analyze the keyword
-            prompt = f"""
+        Returns:
+            List of keyword metrics in the same order as keywords
+        """
+        if not settings.OPENAI_API_KEY:
+            logger.error("OpenAI API key not configured")
+            return [self._get_empty_keyword_metrics(keyword) for keyword in keywords]
+        
+        client = _get_async_openai_client()
+        semaphore = asyncio.Semaphore(KEYWORD_BATCH_CONCURRENCY)
+        
+        async def analyze(keyword: str) -> Dict[str, Any]:
+            async with semaphore:
+                response = await client.chat.completions.create(
+                    **self._keyword_completion_args(keyword)
+                )
+            result = self._build_keyword_result(keyword, response.choices[0].message.content)
+            _cache_put(('keyword_difficulty', keyword.strip().lower()), result, KEYWORD_CACHE_TTL)
+            return result
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[str, str] = {}
+        for keyword in keywords:
+            normalized = keyword.strip().lower()
+            if normalized in results or normalized in pending:
+                continue
+            cached = _cache_get(('keyword_difficulty', normalized))
+            if cached is not None:
+                results[normalized] = cached
+            else:
+                pending[normalized] = keyword
+        
+        analyses = await asyncio.gather(
+            *[analyze(keyword) for keyword in pending.values()], return_exceptions=True
+        )
+        for (normalized, keyword), analysis in zip(pending.items(), analyses):
+            if isinstance(analysis, Exception):
+                logger.error(f"Keyword analysis failed for {keyword}: {str(analysis)}")
+                analysis = self._get_empty_keyword_metrics(keyword)
+            results[normalized] = analysis
+        
+        return [dict(results[keyword.strip().lower()]) for keyword in keywords]
+    
+    
+    def _keyword_completion_args(self, keyword: str) -> Dict[str, Any]:
+        """Chat completion arguments for the keyword analysis prompt"""
+        prompt = f"""
     Analyze this SEO keyword: "{keyword}"
 
     Provide accurate SEO metrics estimation in JSON format:
@@ -454,60 +726,49 @@ class MozAPIService:
 
     Return ONLY valid JSON with no markdown.
     """
-            
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are an expert SEO analyst. Analyze keywords and provide accurate metric estimates in JSON format only."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
-            # Get response
-            response_content = response.choices[0].message.content.strip()
-            
-            # Remove markdown if present
-            if response_content.startswith('```'):
-                response_content = response_content.split('```')[1]
-                if response_content.startswith('json'):
-                    response_content = response_content[4:]
-                response_content = response_content.strip()
-            
-            # Parse JSON
-            import json
-            analysis = json.loads(response_content)
-            
-            logger.info(f" AI keyword analysis complete:")
-            logger.info(f"   Keyword: {keyword}")
-            logger.info(f"   Volume: {analysis.get('search_volume', 0):,}")
-            logger.info(f"   Difficulty: {analysis.get('difficulty', 0)}/100")
-            logger.info(f"   Type: {analysis.get('keyword_type', 'unknown')}")
-            
-            return {
-                'success': True,
-                'keyword': keyword,
-                'search_volume': analysis.get('search_volume', 0),
-                'difficulty': analysis.get('difficulty', 50),
-                'organic_ctr': analysis.get('organic_ctr', 25.0),
-                'priority': analysis.get('priority', 50),
-                'cpc': 0,
-                'keyword_type': analysis.get('keyword_type', 'informational'),
-                'competition_level': analysis.get('competition_level', 'medium'),
-                'data_source': 'AI-powered analysis (OpenAI GPT-4)',
-                'note': 'Estimates generated by AI. For real data, Moz Keyword Explorer API required (separate subscription).'
-            }
-            
-        except Exception as e:
-            logger.error(f"Keyword analysis failed: {str(e)}")
-            raise Exception(f"Failed to analyze keyword: {str(e)}")
+        
+        return {
+            'model': KEYWORD_ANALYSIS_MODEL,
+            'response_format': {"type": "json_object"},
+            'messages': [
+                {
+                    "role": "system", 
+                    "content": "You are an expert SEO analyst. Analyze keywords and provide accurate metric estimates in JSON format only."
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            'temperature': 0.7,
+            'max_tokens': 500
+        }
+    
+    
+    def _build_keyword_result(self, keyword: str, content: str) -> Dict[str, Any]:
+        """Build keyword metrics from the model's JSON answer"""
+        # JSON mode guarantees a bare JSON object
+        analysis = orjson.loads(content)
+        
+        logger.info(f" AI keyword analysis complete:")
+        logger.info(f"   Keyword: {keyword}")
+        logger.info(f"   Volume: {analysis.get('search_volume', 0):,}")
+        logger.info(f"   Difficulty: {analysis.get('difficulty', 0)}/100")
+        logger.info(f"   Type: {analysis.get('keyword_type', 'unknown')}")
+        
+        return {
+            'success': True,
+            'keyword': keyword,
+            'search_volume': analysis.get('search_volume', 0),
+            'difficulty': analysis.get('difficulty', 50),
+            'organic_ctr': analysis.get('organic_ctr', 25.0),
+            'priority': analysis.get('priority', 50),
+            'cpc': 0,
+            'keyword_type': analysis.get('keyword_type', 'informational'),
+            'competition_level': analysis.get('competition_level', 'medium'),
+            'data_source': f'AI-powered analysis (OpenAI {KEYWORD_ANALYSIS_MODEL})',
+            'note': 'Estimates generated by AI. For real data, Moz Keyword Explorer API required (separate subscription).'
+        }
 
 
     def _get_empty_keyword_metrics(self, keyword: str) -> Dict[str, Any]:
@@ -520,13 +781,4 @@ class MozAPIService:
         Returns:
             Dictionary with empty/default keyword metrics
         """
-        return {
-            'success': False,
-            'keyword': keyword,
-            'search_volume': 0,
-            'difficulty': 0,
-            'organic_ctr': 0,
-            'priority': 0,
-            'cpc': 0,
-            'error': 'No data available'
-        }
\ No newline at end of file
+        return {**_EMPTY_KEYWORD_METRICS, 'keyword': keyword}
\ No newline at end of file
@@ -1,30 +1,159 @@
 """
 OTP Service for Email and SMS verification
 """
-import random
+import asyncio
 import hashlib
 import hmac
+import logging
+import queue
+import secrets
+import ssl
+import time
+from string import Template
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import pymysql
-from twilio.rest import Client
+import redis
+import requests
+from requests.adapters import HTTPAdapter
+from fastapi import BackgroundTasks
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 
 from app.core.config import settings
 from app.core.security import get_db_connection
+from app.utils.redis_client import get_redis, mark_redis_down, redis_available
+from app.utils.resilience import CircuitBreaker, call_with_retry, is_transient_http_error
+
+logger = logging.getLogger(__name__)
+
+# Keyed HMAC state; copy() it per OTP instead of re-running the key schedule
+_HMAC_KEY = hmac.new(settings.SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+
+# Maximum number of in-flight Twilio requests during a batch SMS send
+SMS_BATCH_CONCURRENCY = 10
+
+# Twilio's Messages REST endpoint, called directly through one process-wide
+# session so SMS sends reuse keep-alive connections
+TWILIO_MESSAGES_URL = (
+    f"https://api.twilio.com/2010-04-01/Accounts/{settings.TWILIO_ACCOUNT_SID}/Messages.json"
+)
+
+# (connect, read) timeouts so a stalled provider can't pin a worker
+TWILIO_TIMEOUT = (3.0, 10.0)
+SMTP_TIMEOUT = 10
+
+_twilio_breaker = CircuitBreaker("Twilio")
+
+_twilio_session = requests.Session()
+_twilio_session.auth = (settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+_twilio_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=SMS_BATCH_CONCURRENCY))
+
+
+# OTP email body, parsed once
+_EMAIL_TEMPLATE = Template("""\
+<html>
+<body style="font-family: Arial, sans-serif; padding: 20px;">
+    <div style="max-width: 600px; margin: 0 auto; background: linear-gradient(135deg, #9926F3, #1DD8FC); padding: 40px; border-radius: 10px;">
+        <h1 style="color: white; text-align: center;">PanvelIQ Verification</h1>
+        <div style="background: white; padding: 30px; border-radius: 8px; margin-top: 20px;">
+            <p>Your verification code is:</p>
+            <h2 style="text-align: center; font-size: 36px; letter-spacing: 8px; color: #9926F3;">$otp</h2>
+            <p style="color: #666; font-size: 14px;">This code will expire in $minutes minutes.</p>
+            <p style="color: #666; font-size: 14px;">If you didn't request this code, please ignore this email.</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
+def _is_retryable_sms_error(exc: Exception) -> bool:
+    """Transient Twilio failures, except read timeouts where the SMS may already be queued"""
+    return is_transient_http_error(exc) and not isinstance(exc, requests.ReadTimeout)
+
+
+def _contact_column(identifier_type: str) -> str:
+    """otp_verifications column holding an identifier of this type"""
+    return 'phone' if identifier_type == 'phone' else 'email'
+
+
+def _blacklist_key(identifier: str, identifier_type: str) -> str:
+    return f"otp:bl:{identifier_type}:{identifier}"
+
+
+def _last_sent_key(identifier: str) -> str:
+    return f"otp:last:{identifier}"
+
+
+# Port for implicit TLS (SMTPS); any other port upgrades with STARTTLS
+SMTPS_PORT = 465
+
+# One TLS context for every SMTP connection so its session cache is shared
+_smtp_ssl_context = ssl.create_default_context()
+
+# Authenticated SMTP sessions kept open between emails
+SMTP_POOL_SIZE = 4
+_smtp_pool: "queue.LifoQueue[smtplib.SMTP]" = queue.LifoQueue(maxsize=SMTP_POOL_SIZE)
+
+
+def _connect_smtp() -> smtplib.SMTP:
+    """Open a new SMTP session, secure it with TLS and log in once"""
+    logger.debug("Connecting to SMTP server %s:%s", settings.SMTP_HOST, settings.SMTP_PORT)
+    if settings.SMTP_PORT == SMTPS_PORT:
+        # Implicit TLS: no plaintext EHLO/STARTTLS round-trip first
+        server = smtplib.SMTP_SSL(
+            settings.SMTP_HOST, settings.SMTP_PORT,
+            timeout=SMTP_TIMEOUT, context=_smtp_ssl_context
+        )
+    else:
+        server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=SMTP_TIMEOUT)
+    try:
+        if not isinstance(server, smtplib.SMTP_SSL):
+            server.starttls(context=_smtp_ssl_context)
+        server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _close_smtp(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+def _checkout_smtp() -> smtplib.SMTP:
+    """Take a live session from the pool, or open a new one"""
+    while True:
+        try:
+            server = _smtp_pool.get_nowait()
+        except queue.Empty:
+            return _connect_smtp()
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        _close_smtp(server)
+
+
+def _checkin_smtp(server: smtplib.SMTP) -> None:
+    """Return a healthy session to the pool; close it if the pool is full"""
+    try:
+        _smtp_pool.put_nowait(server)
+    except queue.Full:
+        _close_smtp(server)
 
 
 class OTPService:
     """Handles OTP generation, delivery, and verification"""
     
     def __init__(self):
-        # Twilio configuration
-        self.twilio_client = Client(
-            settings.TWILIO_ACCOUNT_SID,
-            settings.TWILIO_AUTH_TOKEN
-        )
+        # Twilio configuration (session is shared, see _twilio_session)
         self.twilio_phone = settings.TWILIO_PHONE_NUMBER
         
         # Rate limiting
@@ -38,46 +167,112 @@ class OTPService:
         Generate cryptographically secure OTP
         Returns: (otp_code, otp_hash)
         """
-        otp = ''.join([str(random.SystemRandom().randint(0, 9)) for _ in range(length)])
+        otp = str(secrets.randbelow(10 ** length)).zfill(length)
         
         # Create HMAC hash for secure storage
-        salt = settings.SECRET_KEY.encode()
-        otp_hash = hmac.new(salt, otp.encode(), hashlib.sha256).hexdigest()
+        h = _HMAC_KEY.copy()
+        h.update(otp.encode())
+        otp_hash = h.hexdigest()
         
         return otp, otp_hash
     
+    def _cache_blacklist(self, identifier: str, identifier_type: str, seconds: int) -> None:
+        if not redis_available():
+            return
+        try:
+            get_redis().setex(_blacklist_key(identifier, identifier_type), max(seconds, 1), 1)
+        except redis.RedisError as e:
+            mark_redis_down()
+            logger.warning(f"OTP blacklist cache write failed: {str(e)}")
+    
+    def _cache_last_sent(self, identifier: str, sent_at: float) -> None:
+        remaining = int(self.RATE_LIMIT_WINDOW - (time.time() - sent_at))
+        if remaining <= 0 or not redis_available():
+            return
+        try:
+            get_redis().setex(_last_sent_key(identifier), remaining, sent_at)
+        except redis.RedisError as e:
+            mark_redis_down()
+            logger.warning(f"OTP rate-limit cache write failed: {str(e)}")
+    
+    def _cached_rate_limit(self, identifier: str, identifier_type: str) -> Optional[Dict]:
+        """
+        Answer a blocked/too-soon request from Redis
+        
+        Returns None when Redis has nothing (or is down). A miss isn't proof
+        the request is allowed, so the caller confirms against MySQL.
+        """
+        if not redis_available():
+            return None
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            pipe.exists(_blacklist_key(identifier, identifier_type))
+            pipe.get(_last_sent_key(identifier))
+            blocked, last_sent = pipe.execute()
+        except redis.RedisError as e:
+            mark_redis_down()
+            logger.warning(f"OTP rate-limit cache read failed: {str(e)}")
+            return None
+        
+        if blocked:
+            return {
+                'allowed': False,
+                'reason': 'Too many failed attempts. Try again later.'
+            }
+        if last_sent:
+            time_diff = time.time() - float(last_sent)
+            if time_diff < self.RATE_LIMIT_WINDOW:
+                return {
+                    'allowed': False,
+                    'reason': f'Please wait {int(self.RATE_LIMIT_WINDOW - time_diff)} seconds before requesting another OTP.'
+                }
+        return None
+    
     def check_rate_limit(self, identifier: str, identifier_type: str) -> Dict:
         """Check if identifier is rate-limited"""
+        cached = self._cached_rate_limit(identifier, identifier_type)
+        if cached is not None:
+            return cached
+        
         connection = get_db_connection()
         cursor = connection.cursor(pymysql.cursors.DictCursor)
         
         try:
-            # Check blacklist
-            cursor.execute("""
-                SELECT * FROM otp_blacklist 
-                WHERE identifier = %s 
-                AND identifier_type = %s 
-                AND blocked_until > NOW()
-            """, (identifier, identifier_type))
+            # Blacklist and most recent OTP in one round-trip
+            # Match the one column this identifier type lives in so the
+            # phone/email index can be used (an OR across both can't)
+            cursor.execute(f"""
+                SELECT
+                    (
+                        SELECT MAX(blocked_until) FROM otp_blacklist 
+                        WHERE identifier = %s 
+                        AND identifier_type = %s 
+                        AND blocked_until > NOW()
+                    ) AS blocked_until,
+                    (
+                        SELECT created_at FROM otp_verifications 
+                        WHERE {_contact_column(identifier_type)} = %s
+                        ORDER BY created_at DESC 
+                        LIMIT 1
+                    ) AS last_sent_at
+            """, (identifier, identifier_type, identifier))
             
-            if cursor.fetchone():
+            row = cursor.fetchone()
+            if row['blocked_until']:
+                self._cache_blacklist(
+                    identifier, identifier_type,
+                    int((row['blocked_until'] - datetime.now()).total_seconds())
+                )
                 return {
                     'allowed': False,
                     'reason': 'Too many failed attempts. Try again later.'
                 }
             
-            # Check recent OTP requests (rate limiting)
-            cursor.execute("""
-                SELECT created_at FROM otp_verifications 
-                WHERE (phone = %s OR email = %s)
-                ORDER BY created_at DESC 
-                LIMIT 1
-            """, (identifier, identifier))
-            
-            recent = cursor.fetchone()
-            if recent:
-                time_diff = (datetime.now() - recent['created_at']).total_seconds()
+            # Rate limiting
+            if row['last_sent_at']:
+                time_diff = (datetime.now() - row['last_sent_at']).total_seconds()
                 if time_diff < self.RATE_LIMIT_WINDOW:
+                    self._cache_last_sent(identifier, time.time() - time_diff)
                     return {
                         'allowed': False,
                         'reason': f'Please wait {int(self.RATE_LIMIT_WINDOW - time_diff)} seconds before requesting another OTP.'
@@ -92,99 +287,176 @@ class OTPService:
     def send_sms_otp(self, phone: str, otp: str, purpose: str = 'verification') -> Dict:
         """Send OTP via SMS using Twilio"""
         try:
-            print(f"📱 [SMS OTP] Attempting to send OTP to: {phone}")
-            print(f"📱 [SMS OTP] OTP Code: {otp}")
-            print(f"📱 [SMS OTP] Twilio Config:")
-            print(f"   - Account SID: {settings.TWILIO_ACCOUNT_SID[:10]}..." if settings.TWILIO_ACCOUNT_SID else "   - Account SID: NOT SET")
-            print(f"   - Auth Token: {'SET' if settings.TWILIO_AUTH_TOKEN else 'NOT SET'}")
-            print(f"   - From Number: {settings.TWILIO_PHONE_NUMBER}")
+            logger.debug("Sending SMS OTP to %s from %s", phone, self.twilio_phone)
             
-            message = self.twilio_client.messages.create(
-                body=f"Your PanvelIQ verification code is: {otp}. Valid for {self.OTP_EXPIRY_MINUTES} minutes. Do not share this code.",
-                from_=self.twilio_phone,
-                to=phone
-            )
+            data = {
+                'Body': f"Your PanvelIQ verification code is: {otp}. Valid for {self.OTP_EXPIRY_MINUTES} minutes. Do not share this code.",
+                'From': self.twilio_phone,
+                'To': phone
+            }
             
-            print(f"✅ [SMS OTP] SMS sent successfully. Message SID: {message.sid}")
+            def _post() -> requests.Response:
+                response = _twilio_session.post(TWILIO_MESSAGES_URL, data=data, timeout=TWILIO_TIMEOUT)
+                response.raise_for_status()
+                return response
+            
+            message = call_with_retry(
+                _post,
+                breaker=_twilio_breaker,
+                retry_if=_is_retryable_sms_error,
+                attempts=2,
+                min_wait=0.2,
+                max_wait=1.0
+            ).json()
+            
+            logger.info("SMS OTP sent to %s (message SID %s)", phone, message['sid'])
             return {
                 'success': True,
-                'message_sid': message.sid,
-                'status': message.status
+                'message_sid': message['sid'],
+                'status': message['status']
             }
             
         except Exception as e:
-            print(f"❌ [SMS OTP] Failed to send: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Failed to send SMS OTP to %s", phone)
             return {
                 'success': False,
                 'error': str(e)
             }
             
 
+    def _build_email_otp(self, email: str, otp: str) -> EmailMessage:
+        # Single text/html part; a multipart wrapper around one part adds nothing
+        msg = EmailMessage()
+        msg['Subject'] = f'PanvelIQ Verification Code - {otp}'
+        msg['From'] = settings.SMTP_FROM_EMAIL
+        msg['To'] = email
+        msg.set_content(
+            _EMAIL_TEMPLATE.substitute(otp=otp, minutes=self.OTP_EXPIRY_MINUTES),
+            subtype='html'
+        )
+        return msg
+
     def send_email_otp(self, email: str, otp: str, purpose: str = 'verification') -> Dict:
         """Send OTP via Email"""
         try:
-            print(f"📧 [EMAIL OTP] Attempting to send OTP to: {email}")
-            print(f"📧 [EMAIL OTP] OTP Code: {otp}")
-            print(f"📧 [EMAIL OTP] SMTP Config:")
-            print(f"   - Host: {settings.SMTP_HOST}")
-            print(f"   - Port: {settings.SMTP_PORT}")
-            print(f"   - Username: {settings.SMTP_USERNAME}")
-            print(f"   - Password: {'SET' if settings.SMTP_PASSWORD else 'NOT SET'}")
-            
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f'PanvelIQ Verification Code - {otp}'
-            msg['From'] = settings.SMTP_FROM_EMAIL
-            msg['To'] = email
-            
-            html = f"""
-            <html>
-            <body style="font-family: Arial, sans-serif; padding: 20px;">
-                <div style="max-width: 600px; margin: 0 auto; background: linear-gradient(135deg, #9926F3, #1DD8FC); padding: 40px; border-radius: 10px;">
-                    <h1 style="color: white; text-align: center;">PanvelIQ Verification</h1>
-                    <div style="background: white; padding: 30px; border-radius: 8px; margin-top: 20px;">
-                        <p>Your verification code is:</p>
-                        <h2 style="text-align: center; font-size: 36px; letter-spacing: 8px; color: #9926F3;">{otp}</h2>
-                        <p style="color: #666; font-size: 14px;">This code will expire in {self.OTP_EXPIRY_MINUTES} minutes.</p>
-                        <p style="color: #666; font-size: 14px;">If you didn't request this code, please ignore this email.</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
+            logger.debug("Sending email OTP to %s", email)
             
-            msg.attach(MIMEText(html, 'html'))
+            msg = self._build_email_otp(email, otp)
             
-            print(f"📧 [EMAIL OTP] Connecting to SMTP server...")
-            with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-                print(f"📧 [EMAIL OTP] Starting TLS...")
-                server.starttls()
-                print(f"📧 [EMAIL OTP] Logging in...")
-                server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-                print(f"📧 [EMAIL OTP] Sending email...")
+            server = _checkout_smtp()
+            try:
                 server.send_message(msg)
+            except Exception:
+                # Don't hand a session in an unknown state back to the pool
+                _close_smtp(server)
+                raise
+            _checkin_smtp(server)
             
-            print(f"✅ [EMAIL OTP] Email sent successfully to {email}")
+            logger.info("Email OTP sent to %s", email)
             return {'success': True}
             
         except Exception as e:
-            print(f"❌ [EMAIL OTP] Failed to send: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Failed to send email OTP to %s", email)
             return {'success': False, 'error': str(e)}
 
+    def send_email_otp_batch(
+        self,
+        recipients: List[Tuple[str, str]],
+        purpose: str = 'verification'
+    ) -> List[Dict]:
+        """
+        Send OTP emails to many (email, otp) pairs over one SMTP session
+        
+        Returns one result dict per recipient, in order. A refused recipient
+        doesn't stop the batch; a dropped connection is reopened once.
+        """
+        results = []
+        server = None
+        try:
+            for email, otp in recipients:
+                msg = self._build_email_otp(email, otp)
+                try:
+                    if server is None:
+                        server = _checkout_smtp()
+                    try:
+                        server.send_message(msg)
+                    except smtplib.SMTPServerDisconnected:
+                        server.close()
+                        server = _connect_smtp()
+                        server.send_message(msg)
+                except smtplib.SMTPRecipientsRefused as e:
+                    logger.warning("Email OTP to %s refused: %s", email, e.recipients)
+                    results.append({'success': False, 'error': str(e)})
+                except Exception as e:
+                    logger.exception("Failed to send email OTP to %s", email)
+                    results.append({'success': False, 'error': str(e)})
+                    if server is not None:
+                        _close_smtp(server)
+                        server = None
+                else:
+                    results.append({'success': True})
+        finally:
+            if server is not None:
+                _checkin_smtp(server)
+        
+        logger.info(
+            "Email OTP batch: %d of %d sent",
+            sum(r['success'] for r in results), len(recipients)
+        )
+        return results
+
+    async def send_sms_otp_batch(
+        self,
+        recipients: List[Tuple[str, str]],
+        purpose: str = 'verification'
+    ) -> List[Dict]:
+        """
+        Send OTP SMS to many (phone, otp) pairs with bounded concurrency
+        
+        Twilio has no bulk endpoint for per-recipient bodies, so messages are
+        sent concurrently over the shared Twilio session instead.
+        """
+        semaphore = asyncio.Semaphore(SMS_BATCH_CONCURRENCY)
+        
+        async def _send(phone: str, otp: str) -> Dict:
+            async with semaphore:
+                return await self.send_sms_otp_async(phone, otp, purpose)
+        
+        return await asyncio.gather(*[_send(phone, otp) for phone, otp in recipients])
+
+    def send_otp(self, identifier: str, identifier_type: str, otp: str, purpose: str) -> Dict:
+        """Deliver an OTP over SMS or email depending on identifier_type"""
+        if identifier_type == 'phone':
+            return self.send_sms_otp(identifier, otp, purpose)
+        return self.send_email_otp(identifier, otp, purpose)
+
+    # Async twins for callers on the event loop. The sends run in a worker
+    # thread so they still share the pooled SMTP sessions and Twilio session.
+
+    async def send_sms_otp_async(self, phone: str, otp: str, purpose: str = 'verification') -> Dict:
+        return await asyncio.to_thread(self.send_sms_otp, phone, otp, purpose)
+
+    async def send_email_otp_async(self, email: str, otp: str, purpose: str = 'verification') -> Dict:
+        return await asyncio.to_thread(self.send_email_otp, email, otp, purpose)
+
+    async def send_otp_async(self, identifier: str, identifier_type: str, otp: str, purpose: str) -> Dict:
+        return await asyncio.to_thread(self.send_otp, identifier, identifier_type, otp, purpose)
+
     def create_otp(
         self,
         identifier: str,
         identifier_type: str,
         purpose: str,
         user_id: Optional[int] = None,
-        ip_address: Optional[str] = None
+        ip_address: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> Dict:
         """
         Create and send OTP
         identifier_type: 'phone' or 'email'
+        
+        When background_tasks is given the SMS/email is sent after the
+        response goes out, so the caller doesn't wait on Twilio/SMTP.
         """
         # Rate limit check
         rate_check = self.check_rate_limit(identifier, identifier_type)
@@ -208,7 +480,7 @@ class OTPService:
                 user_id,
                 identifier if identifier_type == 'phone' else None,
                 identifier if identifier_type == 'email' else None,
-                otp_code,  # Store for development; remove in production
+                '',  # otp_code: the plaintext is no longer stored; the column may be NOT NULL
                 otp_hash,
                 purpose,
                 expires_at,
@@ -216,20 +488,28 @@ class OTPService:
             ))
             connection.commit()
             otp_id = cursor.lastrowid
+            if settings.ENVIRONMENT == 'development':
+                logger.debug("OTP %s for %s: %s", otp_id, identifier, otp_code)
+            self._cache_last_sent(identifier, time.time())
+            
+            result = {
+                'success': True,
+                'otp_id': otp_id,
+                'expires_in_minutes': self.OTP_EXPIRY_MINUTES,
+                'message': f'OTP sent to {identifier}'
+            }
+            
+            if background_tasks is not None:
+                background_tasks.add_task(
+                    self.send_otp, identifier, identifier_type, otp_code, purpose
+                )
+                return result
             
             # Send OTP
-            if identifier_type == 'phone':
-                send_result = self.send_sms_otp(identifier, otp_code, purpose)
-            else:
-                send_result = self.send_email_otp(identifier, otp_code, purpose)
+            send_result = self.send_otp(identifier, identifier_type, otp_code, purpose)
             
             if send_result['success']:
-                return {
-                    'success': True,
-                    'otp_id': otp_id,
-                    'expires_in_minutes': self.OTP_EXPIRY_MINUTES,
-                    'message': f'OTP sent to {identifier}'
-                }
+                return result
             else:
                 return {
                     'success': False,
@@ -254,58 +534,52 @@ class OTPService:
         cursor = connection.cursor(pymysql.cursors.DictCursor)
         
         try:
-            # Fetch latest unverified OTP
-            cursor.execute("""
+            # Fetch latest unverified OTP and lock it until commit, so
+            # concurrent verifies of the same code can't both count as one
+            # attempt or both succeed
+            # Phone numbers are validated as E.164, so only emails contain '@'
+            identifier_type = 'email' if '@' in identifier else 'phone'
+            connection.begin()
+            cursor.execute(f"""
                 SELECT * FROM otp_verifications 
-                WHERE (phone = %s OR email = %s)
+                WHERE {_contact_column(identifier_type)} = %s
                 AND purpose = %s
                 AND verified = FALSE
                 AND expires_at > NOW()
                 AND attempts < %s
                 ORDER BY created_at DESC 
                 LIMIT 1
-            """, (identifier, identifier, purpose, self.MAX_ATTEMPTS))
+                FOR UPDATE
+            """, (identifier, purpose, self.MAX_ATTEMPTS))
             
             otp_record = cursor.fetchone()
             
             if not otp_record:
+                connection.rollback()
                 return {
                     'success': False,
                     'error': 'Invalid or expired OTP'
                 }
             
             # Verify OTP
-            salt = settings.SECRET_KEY.encode()
-            provided_hash = hmac.new(salt, otp_code.encode(), hashlib.sha256).hexdigest()
-            
-            # Increment attempts
-            cursor.execute("""
-                UPDATE otp_verifications 
-                SET attempts = attempts + 1 
-                WHERE otp_id = %s
-            """, (otp_record['otp_id'],))
+            h = _HMAC_KEY.copy()
+            h.update(otp_code.encode())
+            provided_hash = h.hexdigest()
             
-            if provided_hash == otp_record['otp_hash']:
-                # Success - mark as verified
+            if hmac.compare_digest(provided_hash, otp_record['otp_hash']):
+                # Success - count the attempt, mark as verified and update the
+                # user's verification status in a single statement
                 cursor.execute("""
-                    UPDATE otp_verifications 
-                    SET verified = TRUE, verified_at = NOW()
-                    WHERE otp_id = %s
+                    UPDATE otp_verifications o
+                    LEFT JOIN users u ON u.user_id = o.user_id
+                    SET o.attempts = o.attempts + 1,
+                        o.verified = TRUE,
+                        o.verified_at = NOW(),
+                        u.phone_verified = IF(o.phone <> '', TRUE, u.phone_verified),
+                        u.email_verified = IF(o.email <> '', TRUE, u.email_verified)
+                    WHERE o.otp_id = %s
                 """, (otp_record['otp_id'],))
                 
-                # Update user verification status
-                if otp_record['user_id']:
-                    if otp_record['phone']:
-                        cursor.execute(
-                            "UPDATE users SET phone_verified = TRUE WHERE user_id = %s",
-                            (otp_record['user_id'],)
-                        )
-                    if otp_record['email']:
-                        cursor.execute(
-                            "UPDATE users SET email_verified = TRUE WHERE user_id = %s",
-                            (otp_record['user_id'],)
-                        )
-                
                 connection.commit()
                 
                 return {
@@ -314,6 +588,13 @@ class OTPService:
                     'user_id': otp_record['user_id']
                 }
             else:
+                # Increment attempts
+                cursor.execute("""
+                    UPDATE otp_verifications 
+                    SET attempts = attempts + 1 
+                    WHERE otp_id = %s
+                """, (otp_record['otp_id'],))
+                
                 # Failed attempt
                 remaining_attempts = self.MAX_ATTEMPTS - (otp_record['attempts'] + 1)
                 
@@ -336,6 +617,9 @@ class OTPService:
                     ))
                     
                     connection.commit()
+                    self._cache_blacklist(
+                        identifier_val, identifier_type, self.BLACKLIST_DURATION_HOURS * 3600
+                    )
                     
                     return {
                         'success': False,
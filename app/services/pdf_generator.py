@@ -1,9 +1,11 @@
 """
 Professional Interactive PDF Generator for Proposals
-Uses ReportLab with advanced features
+Uses ReportLab with advanced features (install reportlab[accel] for the C speedups)
 File: app/services/pdf_generator.py
 """
 
+import logging
+
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, mm
@@ -16,132 +18,275 @@ from reportlab.lib import colors
 from reportlab.pdfgen import canvas
 from reportlab.graphics.shapes import Drawing, Rect, Line
 from reportlab.graphics import renderPDF
+from reportlab import rl_config
 from io import BytesIO
 from datetime import datetime
+from functools import lru_cache, partial
+from xml.sax.saxutils import escape
 import json
 
+logger = logging.getLogger(__name__)
+
+# ReportLab silently falls back to pure Python when its C accelerator
+# (the rl_accel package) is missing, which makes text layout much slower
+try:
+    import _rl_accel  # noqa: F401
+except ImportError:
+    logger.warning("ReportLab C accelerator not installed; PDF generation will be slower (pip install 'reportlab[accel]')")
+
+# Skip ReportLab's per-attribute validation of graphics shapes
+rl_config.shapeChecking = 0
+
+
+# Brand palette
+PURPLE = colors.HexColor('#9926F3')
+CYAN = colors.HexColor('#1DD8FC')
+LIGHT_BG = colors.HexColor('#F8F9FA')
+IMPACT_BG = colors.HexColor('#E8F8FD')
+GRID_GREY = colors.HexColor('#DDDDDD')
+TEXT_DARK = colors.HexColor('#333333')
+TEXT_MUTED = colors.HexColor('#555555')
+TEXT_FOOTER = colors.HexColor('#666666')
+
+
+def _build_styles():
+    """Create professional custom styles"""
+    styles = getSampleStyleSheet()
+    
+    # Cover Page Title
+    styles.add(ParagraphStyle(
+        name='CoverTitle',
+        parent=styles['Heading1'],
+        fontSize=36,
+        textColor=PURPLE,
+        spaceAfter=10,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold',
+        leading=42
+    ))
+    
+    # Cover Subtitle
+    styles.add(ParagraphStyle(
+        name='CoverSubtitle',
+        parent=styles['Normal'],
+        fontSize=18,
+        textColor=CYAN,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica',
+        leading=22
+    ))
+    
+    # Section Heading with Gradient Effect
+    styles.add(ParagraphStyle(
+        name='SectionHeading',
+        parent=styles['Heading1'],
+        fontSize=20,
+        textColor=PURPLE,
+        spaceAfter=15,
+        spaceBefore=20,
+        fontName='Helvetica-Bold',
+        borderWidth=2,
+        borderColor=CYAN,
+        borderPadding=10,
+        backColor=LIGHT_BG,
+        leading=24
+    ))
+    
+    # Subsection Heading
+    styles.add(ParagraphStyle(
+        name='SubHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=CYAN,
+        spaceAfter=10,
+        spaceBefore=15,
+        fontName='Helvetica-Bold',
+        leading=20
+    ))
+    
+    # Body Text - Professional
+    styles.add(ParagraphStyle(
+        name='BodyPro',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=TEXT_DARK,
+        spaceAfter=10,
+        alignment=TA_JUSTIFY,
+        fontName='Helvetica',
+        leading=16
+    ))
+    
+    # Bullet Points
+    styles.add(ParagraphStyle(
+        name='BulletPoint',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=TEXT_MUTED,
+        spaceAfter=8,
+        leftIndent=20,
+        bulletIndent=10,
+        fontName='Helvetica',
+        leading=15
+    ))
+    
+    # Highlighted Box
+    styles.add(ParagraphStyle(
+        name='HighlightBox',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=colors.white,
+        backColor=PURPLE,
+        borderPadding=15,
+        spaceAfter=15,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold',
+        leading=18
+    ))
+    
+    # Footer Text
+    styles.add(ParagraphStyle(
+        name='Footer',
+        parent=styles['Normal'],
+        fontSize=9,
+        textColor=TEXT_FOOTER,
+        alignment=TA_CENTER,
+        fontName='Helvetica',
+        leading=12
+    ))
+    
+    return styles
+
+
+# Table styles shared by every generated PDF
+_CLIENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), PURPLE),
+    ('BACKGROUND', (1, 0), (1, -1), LIGHT_BG),
+    ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
+    ('TEXTCOLOR', (1, 0), (1, -1), TEXT_DARK),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('PADDING', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, GRID_GREY),
+])
+
+_CAMPAIGN_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), PURPLE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, GRID_GREY),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, LIGHT_BG]),
+])
+
+_IMPACT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, 0), CYAN),
+    ('BACKGROUND', (1, 0), (1, 0), IMPACT_BG),
+    ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
+    ('TEXTCOLOR', (1, 0), (1, 0), TEXT_DARK),
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, CYAN),
+])
+
+_PHASE_HEADER_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), PURPLE),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('PADDING', (0, 0), (-1, -1), 10),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+])
+
+_INVESTMENT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), PURPLE),
+    ('BACKGROUND', (0, -1), (-1, -1), CYAN),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('TEXTCOLOR', (0, -1), (-1, -1), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('PADDING', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, GRID_GREY),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, LIGHT_BG]),
+])
+
+# Paragraph markup with a fixed structure, kept out of the per-PDF code paths
+_EXEC_SUMMARY_TMPL = (
+    "This comprehensive digital marketing proposal has been specifically designed for "
+    "<b>{company_name}</b>, a {business_type} "
+    "looking to enhance their digital presence and drive measurable growth."
+    "<br/><br/>"
+    "Our AI-powered approach combines cutting-edge marketing technology with proven strategies "
+    "to deliver exceptional results within your investment budget of <b>${budget:,.2f}</b>."
+    "<br/><br/>"
+    "<b>Key Challenges We'll Address:</b><br/>"
+    "{challenges}"
+    "<br/><br/>"
+    "<b>Target Audience Focus:</b><br/>"
+    "{target_audience}"
+)
+
+_NEXT_STEPS = (
+    "Review this comprehensive proposal and share any questions or feedback",
+    "Schedule a discovery call to discuss your specific goals and requirements",
+    "Finalize the strategy and customize the approach based on your input",
+    "Sign the agreement and begin onboarding process",
+    "Launch your digital marketing campaigns within 2 weeks",
+)
+
+# One paragraph for all steps instead of one per step
+_NEXT_STEPS_TEXT = "<br/>".join(
+    f"<b>Step {idx}:</b> {step}" for idx, step in enumerate(_NEXT_STEPS, 1)
+)
+
+# Investment breakdown: (category, allocation label, share of budget)
+_INVESTMENT_ROWS = (
+    ('Strategy & Planning', '15%', 0.15),
+    ('Creative Development', '20%', 0.20),
+    ('Media & Advertising', '45%', 0.45),
+    ('Analytics & Optimization', '10%', 0.10),
+    ('Management & Support', '10%', 0.10),
+)
+
+_CONTACT_INFO_TEXT = (
+    "<b>PanvelIQ Digital Marketing</b><br/>"
+    "Email: hello@panveliq.com<br/>"
+    "Phone: +1 (555) 123-4567<br/>"
+    "Website: www.panveliq.com<br/><br/>"
+    "We look forward to partnering with you on this exciting journey!"
+)
+
+# Built once per process; every generator shares the same (read-only) styles
+_STYLES = _build_styles()
+
 
 class ProposalPDFGenerator:
     """Professional PDF Generator with Interactive Elements"""
     
+    # Header/footer bar colours
+    HEADER_RGB = (0.6, 0.15, 0.95)  # #9926F3
+    FOOTER_RGB = (0.11, 0.85, 0.99)  # #1DD8FC
+    
     def __init__(self):
         self.width, self.height = A4
-        self.styles = self._create_custom_styles()
-        
-    def _create_custom_styles(self):
-        """Create professional custom styles"""
-        styles = getSampleStyleSheet()
-        
-        # Cover Page Title
-        styles.add(ParagraphStyle(
-            name='CoverTitle',
-            parent=styles['Heading1'],
-            fontSize=36,
-            textColor=colors.HexColor('#9926F3'),
-            spaceAfter=10,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold',
-            leading=42
-        ))
+        self.styles = _STYLES
         
-        # Cover Subtitle
-        styles.add(ParagraphStyle(
-            name='CoverSubtitle',
-            parent=styles['Normal'],
-            fontSize=18,
-            textColor=colors.HexColor('#1DD8FC'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica',
-            leading=22
-        ))
-        
-        # Section Heading with Gradient Effect
-        styles.add(ParagraphStyle(
-            name='SectionHeading',
-            parent=styles['Heading1'],
-            fontSize=20,
-            textColor=colors.HexColor('#9926F3'),
-            spaceAfter=15,
-            spaceBefore=20,
-            fontName='Helvetica-Bold',
-            borderWidth=2,
-            borderColor=colors.HexColor('#1DD8FC'),
-            borderPadding=10,
-            backColor=colors.HexColor('#F8F9FA'),
-            leading=24
-        ))
-        
-        # Subsection Heading
-        styles.add(ParagraphStyle(
-            name='SubHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#1DD8FC'),
-            spaceAfter=10,
-            spaceBefore=15,
-            fontName='Helvetica-Bold',
-            leading=20
-        ))
-        
-        # Body Text - Professional
-        styles.add(ParagraphStyle(
-            name='BodyPro',
-            parent=styles['Normal'],
-            fontSize=11,
-            textColor=colors.HexColor('#333333'),
-            spaceAfter=10,
-            alignment=TA_JUSTIFY,
-            fontName='Helvetica',
-            leading=16
-        ))
-        
-        # Bullet Points
-        styles.add(ParagraphStyle(
-            name='BulletPoint',
-            parent=styles['Normal'],
-            fontSize=11,
-            textColor=colors.HexColor('#555555'),
-            spaceAfter=8,
-            leftIndent=20,
-            bulletIndent=10,
-            fontName='Helvetica',
-            leading=15
-        ))
-        
-        # Highlighted Box
-        styles.add(ParagraphStyle(
-            name='HighlightBox',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.HexColor('#FFFFFF'),
-            backColor=colors.HexColor('#9926F3'),
-            borderPadding=15,
-            spaceAfter=15,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold',
-            leading=18
-        ))
-        
-        # Footer Text
-        styles.add(ParagraphStyle(
-            name='Footer',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=colors.HexColor('#666666'),
-            alignment=TA_CENTER,
-            fontName='Helvetica',
-            leading=12
-        ))
-        
-        return styles
-    
-    def _draw_header_footer(self, canvas_obj, doc, proposal_data):
+    def _draw_header_footer(self, canvas_obj, doc, proposal_data, footer_date):
         """Draw professional header and footer"""
         canvas_obj.saveState()
         
         # Header - Gradient Bar
-        canvas_obj.setFillColorRGB(0.6, 0.15, 0.95)  # #9926F3
+        canvas_obj.setFillColorRGB(*self.HEADER_RGB)
         canvas_obj.rect(0, self.height - 30, self.width, 30, fill=1, stroke=0)
         
         # Company Name in Header
@@ -155,7 +300,7 @@ class ProposalPDFGenerator:
         canvas_obj.drawRightString(self.width - 30, self.height - 20, f"Page {page_num}")
         
         # Footer - Gradient Bar
-        canvas_obj.setFillColorRGB(0.11, 0.85, 0.99)  # #1DD8FC
+        canvas_obj.setFillColorRGB(*self.FOOTER_RGB)
         canvas_obj.rect(0, 0, self.width, 25, fill=1, stroke=0)
         
         # Footer Text
@@ -163,12 +308,12 @@ class ProposalPDFGenerator:
         canvas_obj.setFont('Helvetica', 9)
         canvas_obj.drawCentredString(
             self.width / 2, 10,
-            f"Confidential Proposal • Generated {datetime.now().strftime('%B %d, %Y')}"
+            f"Confidential Proposal • Generated {footer_date}"
         )
         
         canvas_obj.restoreState()
     
-    def _create_cover_page(self, proposal_data):
+    def _create_cover_page(self, proposal_data, generated_on):
         """Create professional cover page"""
         story = []
         
@@ -192,22 +337,11 @@ class ProposalPDFGenerator:
             ['Company:', proposal_data.get('company_name', 'N/A')],
             ['Business Type:', proposal_data.get('business_type', 'N/A')],
             ['Investment Budget:', f"${proposal_data.get('budget', 0):,.2f}"],
-            ['Prepared On:', datetime.now().strftime('%B %d, %Y')],
+            ['Prepared On:', generated_on],
         ]
         
         client_table = Table(client_info, colWidths=[2*inch, 4*inch])
-        client_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#9926F3')),
-            ('BACKGROUND', (1, 0), (1, -1), colors.HexColor('#F8F9FA')),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
-            ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#333333')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('PADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#DDDDDD')),
-        ]))
+        client_table.setStyle(_CLIENT_TABLE_STYLE)
         story.append(client_table)
         
         story.append(Spacer(1, 1*inch))
@@ -228,20 +362,13 @@ class ProposalPDFGenerator:
         story.append(Paragraph("EXECUTIVE SUMMARY", self.styles['SectionHeading']))
         story.append(Spacer(1, 0.2*inch))
         
-        summary_text = f"""
-        This comprehensive digital marketing proposal has been specifically designed for 
-        <b>{proposal_data.get('company_name', 'your organization')}</b>, a {proposal_data.get('business_type', 'business')} 
-        looking to enhance their digital presence and drive measurable growth.
-        <br/><br/>
-        Our AI-powered approach combines cutting-edge marketing technology with proven strategies 
-        to deliver exceptional results within your investment budget of <b>${proposal_data.get('budget', 0):,.2f}</b>.
-        <br/><br/>
-        <b>Key Challenges We'll Address:</b><br/>
-        {proposal_data.get('challenges', 'Market penetration and brand awareness')}
-        <br/><br/>
-        <b>Target Audience Focus:</b><br/>
-        {proposal_data.get('target_audience', 'Defined target market segments')}
-        """
+        summary_text = _EXEC_SUMMARY_TMPL.format_map({
+            'company_name': escape(str(proposal_data.get('company_name', 'your organization'))),
+            'business_type': escape(str(proposal_data.get('business_type', 'business'))),
+            'budget': proposal_data.get('budget', 0),
+            'challenges': escape(str(proposal_data.get('challenges', 'Market penetration and brand awareness'))),
+            'target_audience': escape(str(proposal_data.get('target_audience', 'Defined target market segments'))),
+        })
         
         story.append(Paragraph(summary_text, self.styles['BodyPro']))
         story.append(Spacer(1, 0.3*inch))
@@ -269,16 +396,7 @@ class ProposalPDFGenerator:
             
             if campaign_data:
                 campaign_table = Table(campaign_data, colWidths=[2.5*inch, 4*inch])
-                campaign_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#9926F3')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('PADDING', (0, 0), (-1, -1), 10),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#DDDDDD')),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F8F9FA')]),
-                ]))
+                campaign_table.setStyle(_CAMPAIGN_TABLE_STYLE)
                 story.append(campaign_table)
                 story.append(Spacer(1, 0.2*inch))
         
@@ -287,8 +405,10 @@ class ProposalPDFGenerator:
             story.append(Paragraph("Marketing Automation & Tools", self.styles['SubHeading']))
             
             tools = strategy_data.get('automation_tools', [])[:8]
-            for tool in tools:
-                story.append(Paragraph(f"• {tool}", self.styles['BulletPoint']))
+            story.append(Paragraph(
+                "<br/>".join([f"• {escape(str(tool))}" for tool in tools]),
+                self.styles['BulletPoint']
+            ))
             
             story.append(Spacer(1, 0.2*inch))
         
@@ -323,16 +443,7 @@ class ProposalPDFGenerator:
                     [['Expected Impact:', diff.get('impact', 'Significant positive results')]],
                     colWidths=[1.5*inch, 4.5*inch]
                 )
-                impact_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#1DD8FC')),
-                    ('BACKGROUND', (1, 0), (1, 0), colors.HexColor('#E8F8FD')),
-                    ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
-                    ('TEXTCOLOR', (1, 0), (1, 0), colors.HexColor('#333333')),
-                    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('PADDING', (0, 0), (-1, -1), 10),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#1DD8FC')),
-                ]))
+                impact_table.setStyle(_IMPACT_TABLE_STYLE)
                 diff_content.append(impact_table)
                 diff_content.append(Spacer(1, 0.15*inch))
                 
@@ -356,21 +467,15 @@ class ProposalPDFGenerator:
                     [[phase.get('phase', 'Phase'), phase.get('duration', 'Duration TBD')]],
                     colWidths=[4*inch, 2*inch]
                 )
-                phase_header.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#9926F3')),
-                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 12),
-                    ('PADDING', (0, 0), (-1, -1), 10),
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                ]))
+                phase_header.setStyle(_PHASE_HEADER_STYLE)
                 story.append(phase_header)
                 
                 # Milestones
                 if phase.get('milestones'):
-                    for milestone in phase.get('milestones', []):
-                        story.append(Paragraph(f"✓ {milestone}", self.styles['BulletPoint']))
+                    story.append(Paragraph(
+                        "<br/>".join([f"✓ {escape(str(milestone))}" for milestone in phase['milestones']]),
+                        self.styles['BulletPoint']
+                    ))
                 
                 story.append(Spacer(1, 0.15*inch))
         
@@ -385,33 +490,15 @@ class ProposalPDFGenerator:
         
         budget = proposal_data.get('budget', 0)
         
-        # Sample breakdown (you can customize this based on actual data)
-        investment_data = [
-            ['Investment Category', 'Allocation', 'Amount'],
-            ['Strategy & Planning', '15%', f"${budget * 0.15:,.2f}"],
-            ['Creative Development', '20%', f"${budget * 0.20:,.2f}"],
-            ['Media & Advertising', '45%', f"${budget * 0.45:,.2f}"],
-            ['Analytics & Optimization', '10%', f"${budget * 0.10:,.2f}"],
-            ['Management & Support', '10%', f"${budget * 0.10:,.2f}"],
-            ['', '<b>TOTAL INVESTMENT</b>', f"<b>${budget:,.2f}</b>"],
-        ]
+        # Sample breakdown (you can customize _INVESTMENT_ROWS based on actual data)
+        investment_data = [['Investment Category', 'Allocation', 'Amount']]
+        investment_data.extend(
+            [name, label, f"${budget * share:,.2f}"] for name, label, share in _INVESTMENT_ROWS
+        )
+        investment_data.append(['', '<b>TOTAL INVESTMENT</b>', f"<b>${budget:,.2f}</b>"])
         
         investment_table = Table(investment_data, colWidths=[3*inch, 1.5*inch, 1.5*inch])
-        investment_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#9926F3')),
-            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#1DD8FC')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('TEXTCOLOR', (0, -1), (-1, -1), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('PADDING', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#DDDDDD')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, colors.HexColor('#F8F9FA')]),
-        ]))
+        investment_table.setStyle(_INVESTMENT_TABLE_STYLE)
         story.append(investment_table)
         story.append(Spacer(1, 0.3*inch))
         
@@ -424,40 +511,27 @@ class ProposalPDFGenerator:
         story.append(Paragraph("NEXT STEPS", self.styles['SectionHeading']))
         story.append(Spacer(1, 0.2*inch))
         
-        next_steps = [
-            "Review this comprehensive proposal and share any questions or feedback",
-            "Schedule a discovery call to discuss your specific goals and requirements",
-            "Finalize the strategy and customize the approach based on your input",
-            "Sign the agreement and begin onboarding process",
-            "Launch your digital marketing campaigns within 2 weeks",
-        ]
-        
-        for idx, step in enumerate(next_steps, 1):
-            story.append(Paragraph(
-                f"<b>Step {idx}:</b> {step}",
-                self.styles['BulletPoint']
-            ))
+        story.append(Paragraph(_NEXT_STEPS_TEXT, self.styles['BulletPoint']))
         
         story.append(Spacer(1, 0.3*inch))
         
         # Contact Information
         story.append(Paragraph("CONTACT INFORMATION", self.styles['SubHeading']))
         
-        contact_info = """
-        <b>PanvelIQ Digital Marketing</b><br/>
-        Email: hello@panveliq.com<br/>
-        Phone: +1 (555) 123-4567<br/>
-        Website: www.panveliq.com<br/><br/>
-        We look forward to partnering with you on this exciting journey!
-        """
-        
-        story.append(Paragraph(contact_info, self.styles['BodyPro']))
+        story.append(Paragraph(_CONTACT_INFO_TEXT, self.styles['BodyPro']))
         
         return story
     
-    def generate_pdf(self, proposal_data, strategy_data, diff_data, timeline_data):
-        """Generate complete professional PDF"""
-        buffer = BytesIO()
+    def generate_pdf(self, proposal_data, strategy_data, diff_data, timeline_data, out=None):
+        """
+        Generate complete professional PDF
+        
+        Pass a writable binary file-like object as ``out`` (an open file, a
+        response stream, ...) to have the PDF written straight into it; the
+        method then returns None. Without ``out`` the PDF is built in memory
+        and returned as a BytesIO positioned at the start.
+        """
+        buffer = out if out is not None else BytesIO()
         
         # Create document with custom page template
         doc = SimpleDocTemplate(
@@ -469,11 +543,14 @@ class ProposalPDFGenerator:
             rightMargin=40
         )
         
+        # One date for the cover page and every footer
+        generated_on = datetime.now().strftime('%B %d, %Y')
+        
         # Build story
         story = []
         
         # Cover Page
-        story.extend(self._create_cover_page(proposal_data))
+        story.extend(self._create_cover_page(proposal_data, generated_on))
         
         # Executive Summary
         story.extend(self._create_executive_summary(proposal_data))
@@ -498,11 +575,26 @@ class ProposalPDFGenerator:
         story.extend(self._create_next_steps_section())
         
         # Build PDF with header/footer
-        doc.build(
-            story,
-            onFirstPage=lambda c, d: self._draw_header_footer(c, d, proposal_data),
-            onLaterPages=lambda c, d: self._draw_header_footer(c, d, proposal_data)
+        draw_page = partial(
+            self._draw_header_footer,
+            proposal_data=proposal_data,
+            footer_date=generated_on
         )
+        doc.build(story, onFirstPage=draw_page, onLaterPages=draw_page)
+        
+        if out is not None:
+            return None
         
         buffer.seek(0)
-        return buffer
\ No newline at end of file
+        return buffer
+
+
+@lru_cache(maxsize=1)
+def get_generator() -> ProposalPDFGenerator:
+    """
+    Process-wide ProposalPDFGenerator
+    
+    The generator keeps no per-PDF state on self, so one instance can serve
+    concurrent requests.
+    """
+    return ProposalPDFGenerator()
@@ -0,0 +1,33 @@
+"""
+Shared HTTP Client Sessions
+File: app/utils/http_client.py
+Process-wide aiohttp session reused by async service calls
+"""
+
+from typing import Optional
+
+import aiohttp
+
+
+_aiohttp_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_aiohttp_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it on first use
+
+    Must be called from within the running event loop. Reusing one session
+    keeps connections to the upstream APIs alive between requests.
+    """
+    global _aiohttp_session
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        _aiohttp_session = aiohttp.ClientSession()
+    return _aiohttp_session
+
+
+async def close_aiohttp_session() -> None:
+    """Close the shared aiohttp session (call on application shutdown)"""
+    global _aiohttp_session
+    if _aiohttp_session is not None and not _aiohttp_session.closed:
+        await _aiohttp_session.close()
+    _aiohttp_session = None
@@ -0,0 +1,52 @@
+"""
+Shared Redis Clients
+File: app/utils/redis_client.py
+Process-wide Redis clients used by the report cache, OTP rate limiting, ...
+"""
+
+import time
+from functools import lru_cache
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+
+# Fail fast when Redis isn't running; callers fall back to their source of truth
+_REDIS_TIMEOUT = 0.5
+
+# After a failure Redis is skipped for this many seconds instead of paying
+# the socket timeouts on every request while it is down
+REDIS_RETRY_AFTER = 30.0
+
+_redis_down_until = 0.0
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=_REDIS_TIMEOUT,
+        socket_timeout=_REDIS_TIMEOUT
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_redis() -> aioredis.Redis:
+    return aioredis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=_REDIS_TIMEOUT,
+        socket_timeout=_REDIS_TIMEOUT
+    )
+
+
+def redis_available() -> bool:
+    """False while backing off after a recent Redis failure"""
+    return time.monotonic() >= _redis_down_until
+
+
+def mark_redis_down() -> None:
+    """Skip Redis for REDIS_RETRY_AFTER seconds after a failed call"""
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
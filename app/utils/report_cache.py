@@ -0,0 +1,80 @@
+"""
+Report Cache
+File: app/utils/report_cache.py
+Redis-backed cache for third-party report responses (Google Ads, ...)
+"""
+
+import logging
+from datetime import date
+from typing import Any, Dict, Optional
+
+import orjson
+import redis
+
+from app.utils.redis_client import (
+    get_async_redis,
+    get_redis,
+    mark_redis_down,
+    redis_available
+)
+
+logger = logging.getLogger(__name__)
+
+# Reports ending before today can't change any more; recent ones still fill in
+HISTORIC_REPORT_TTL = 3600
+RECENT_REPORT_TTL = 60
+
+
+def report_cache_ttl(end_date: str) -> int:
+    """Cache lifetime in seconds for a report ending on end_date (YYYY-MM-DD)"""
+    if date.fromisoformat(end_date) < date.today():
+        return HISTORIC_REPORT_TTL
+    return RECENT_REPORT_TTL
+
+
+def get_cached_report(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached report for key, or None on a miss or while Redis is down"""
+    if not redis_available():
+        return None
+    try:
+        cached = get_redis().get(key)
+    except redis.RedisError as e:
+        mark_redis_down()
+        logger.warning(f"Report cache read failed for {key}: {str(e)}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+def set_cached_report(key: str, report: Dict[str, Any], ttl: int) -> None:
+    """Store a report under key for ttl seconds; Redis errors are only logged"""
+    if not redis_available():
+        return
+    try:
+        get_redis().set(key, orjson.dumps(report), ex=ttl)
+    except redis.RedisError as e:
+        mark_redis_down()
+        logger.warning(f"Report cache write failed for {key}: {str(e)}")
+
+
+async def get_cached_report_async(key: str) -> Optional[Dict[str, Any]]:
+    """Async version of get_cached_report"""
+    if not redis_available():
+        return None
+    try:
+        cached = await get_async_redis().get(key)
+    except redis.RedisError as e:
+        mark_redis_down()
+        logger.warning(f"Report cache read failed for {key}: {str(e)}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+async def set_cached_report_async(key: str, report: Dict[str, Any], ttl: int) -> None:
+    """Async version of set_cached_report"""
+    if not redis_available():
+        return
+    try:
+        await get_async_redis().set(key, orjson.dumps(report), ex=ttl)
+    except redis.RedisError as e:
+        mark_redis_down()
+        logger.warning(f"Report cache write failed for {key}: {str(e)}")
@@ -0,0 +1,135 @@
+"""
+Retry and Circuit Breaker Helpers
+File: app/utils/resilience.py
+Shared helpers for calling flaky upstream APIs (GA4, Mailchimp, ...)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import requests
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is skipped because its circuit breaker is open"""
+
+    def __init__(self, name: str):
+        super().__init__(f"{name} temporarily unavailable (circuit open)")
+        self.name = name
+
+
+class CircuitBreaker:
+    """
+    Minimal thread-safe circuit breaker
+
+    After ``fail_max`` consecutive failures the circuit opens and calls are
+    rejected for ``reset_timeout`` seconds. The next call after that is let
+    through; a success closes the circuit, a failure re-opens it.
+    """
+
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return (
+                self._opened_at is not None
+                and time.monotonic() - self._opened_at < self.reset_timeout
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+
+def is_transient_http_error(exc: Exception) -> bool:
+    """Return True for network errors and 429/5xx responses worth retrying"""
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
+
+
+def _backoff_delay(attempt: int, min_wait: float, max_wait: float) -> float:
+    """Exponential backoff with random jitter"""
+    return random.uniform(min_wait, min(max_wait, min_wait * 2 ** attempt))
+
+
+def call_with_retry(
+    func: Callable[[], Any],
+    breaker: Optional[CircuitBreaker] = None,
+    retry_if: Callable[[Exception], bool] = is_transient_http_error,
+    attempts: int = 3,
+    min_wait: float = 0.5,
+    max_wait: float = 4.0
+) -> Any:
+    """
+    Call ``func`` retrying transient failures, guarded by an optional breaker
+
+    Only failures accepted by ``retry_if`` are retried and counted against
+    the breaker; other errors are raised immediately.
+    """
+    if breaker and breaker.is_open:
+        raise CircuitOpenError(breaker.name)
+
+    for attempt in range(1, attempts + 1):
+        try:
+            result = func()
+        except Exception as e:
+            if not retry_if(e):
+                raise
+            if attempt == attempts:
+                if breaker:
+                    breaker.record_failure()
+                raise
+            time.sleep(_backoff_delay(attempt, min_wait, max_wait))
+        else:
+            if breaker:
+                breaker.record_success()
+            return result
+
+
+async def async_call_with_retry(
+    func: Callable[[], Awaitable[Any]],
+    breaker: Optional[CircuitBreaker] = None,
+    retry_if: Callable[[Exception], bool] = is_transient_http_error,
+    attempts: int = 3,
+    min_wait: float = 0.5,
+    max_wait: float = 4.0
+) -> Any:
+    """Async variant of call_with_retry; ``func`` returns a fresh awaitable per attempt"""
+    if breaker and breaker.is_open:
+        raise CircuitOpenError(breaker.name)
+
+    for attempt in range(1, attempts + 1):
+        try:
+            result = await func()
+        except Exception as e:
+            if not retry_if(e):
+                raise
+            if attempt == attempts:
+                if breaker:
+                    breaker.record_failure()
+                raise
+            await asyncio.sleep(_backoff_delay(attempt, min_wait, max_wait))
+        else:
+            if breaker:
+                breaker.record_success()
+            return result
@@ -0,0 +1,11 @@
+-- Indexes for the OTP lookups in app/services/otp_service.py
+-- Apply once against the panvel_iq database (MySQL 8+):
+--   mysql panvel_iq < otp_indexes.sql
+--
+-- check_rate_limit / verify_otp: latest OTP for a phone number or email
+-- (each query filters on exactly one of the two columns)
+CREATE INDEX `idx_otp_phone_created` ON `otp_verifications` (`phone`, `created_at` DESC);
+CREATE INDEX `idx_otp_email_created` ON `otp_verifications` (`email`, `created_at` DESC);
+
+-- check_rate_limit: active blacklist entry for an identifier
+CREATE INDEX `idx_otp_blacklist_lookup` ON `otp_blacklist` (`identifier`, `identifier_type`, `blocked_until`);
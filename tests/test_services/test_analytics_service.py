@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("google.analytics.data_v1beta")
+pytest.importorskip("pydantic_settings")
+
+from app.services.analytics_service import (
+    GoogleAnalyticsService,
+    _format_ga4_date,
+    columns_to_rows,
+    parse_metric_values,
+)
+
+
+def report_row(date, *values):
+    return SimpleNamespace(
+        dimension_values=[SimpleNamespace(value=date)],
+        metric_values=[SimpleNamespace(value=value) for value in values]
+    )
+
+
+ROWS = [
+    report_row("20240105", "10", "8", "2", "30", "0.5123", "12.345", "", "7"),
+    report_row("20240106", "5", "4", "1", "9", "0.25", "3", "1", "2"),
+    report_row("20241231", "", "", "", "", "", "", "", ""),
+]
+
+
+def per_row_daily_data(rows):
+    """The original one-dict-per-row conversion"""
+    return [
+        {
+            "date": f"{d[:4]}-{d[4:6]}-{d[6:8]}",
+            "sessions": int(row.metric_values[0].value or 0),
+            "users": int(row.metric_values[1].value or 0),
+            "new_users": int(row.metric_values[2].value or 0),
+            "page_views": int(row.metric_values[3].value or 0),
+            "bounce_rate": round(float(row.metric_values[4].value or 0) * 100, 2),
+            "avg_session_duration": round(float(row.metric_values[5].value or 0), 2),
+            "conversions": int(row.metric_values[6].value or 0),
+            "engaged_sessions": int(row.metric_values[7].value or 0)
+        }
+        for row in rows
+        for d in [row.dimension_values[0].value]
+    ]
+
+
+def test_format_ga4_date():
+    assert _format_ga4_date("20240105") == "2024-01-05"
+    assert _format_ga4_date("19991231") == "1999-12-31"
+
+
+def test_parse_metric_values_matches_per_row_floats():
+    metrics = parse_metric_values(ROWS, 8)
+
+    assert metrics.shape == (3, 8)
+    expected = [[float(mv.value or 0) for mv in row.metric_values] for row in ROWS]
+    assert metrics.tolist() == expected
+
+
+def test_parse_metric_values_without_rows():
+    assert parse_metric_values([], 8).shape == (0, 8)
+
+
+def test_columns_to_rows():
+    columns = {"date": ["2024-01-05", "2024-01-06"], "sessions": [10, 5]}
+
+    assert columns_to_rows(columns) == [
+        {"date": "2024-01-05", "sessions": 10},
+        {"date": "2024-01-06", "sessions": 5},
+    ]
+
+
+def test_daily_data_matches_per_row_conversion():
+    service = GoogleAnalyticsService.__new__(GoogleAnalyticsService)
+    columns = service._build_daily_columns(ROWS)
+
+    response = service._build_response("1", "2024-01-05", "2024-12-31", columns, [], [])
+
+    expected = per_row_daily_data(ROWS)
+    assert [day.pop("date") for day in response["daily_data"]] == [day.pop("date") for day in expected]
+    # np.round breaks exact decimal ties (12.345) differently from round()
+    for day, expected_day in zip(response["daily_data"], expected):
+        assert day == pytest.approx(expected_day, abs=0.01)
+    assert response["summary"]["total_sessions"] == 15
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+requests = pytest.importorskip("requests")
+orjson = pytest.importorskip("orjson")
+pytest.importorskip("pydantic_settings")
+
+from app.services.email_service import EmailService, _is_retryable_post_error
+
+
+def http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+def test_post_retries_only_unsent_requests():
+    assert _is_retryable_post_error(requests.ConnectionError())
+    assert _is_retryable_post_error(requests.ConnectTimeout())
+    assert _is_retryable_post_error(http_error(429))
+
+    assert not _is_retryable_post_error(requests.ReadTimeout())
+    assert not _is_retryable_post_error(http_error(500))
+    assert not _is_retryable_post_error(http_error(400))
+
+
+def test_bulk_send_matches_statuses_case_insensitively():
+    sent = {}
+
+    async def fake_request(method, url, breaker, json=None):
+        sent.update(json)
+        response = requests.Response()
+        response._content = orjson.dumps([
+            {"email": "alice@example.com", "status": "sent", "_id": "1"},
+            {"email": "bob@example.com", "status": "rejected", "_id": "2"},
+        ])
+        return response
+
+    service = EmailService.__new__(EmailService)
+    service.api_key = "key"
+    service._request = fake_request
+
+    results = asyncio.run(service.send_bulk_mailchimp(
+        ["Alice@Example.com", " bob@example.com", "carol@example.com"], "Hi", "<p>Hi</p>"
+    ))
+
+    assert [r["success"] for r in results] == [True, False, False]
+    assert results[1]["status"] == "rejected"
+    assert results[2]["error"] == "No status returned by Mailchimp"
+    assert sent["message"]["merge_language"] == "handlebars"
+    assert [v["rcpt"] for v in sent["message"]["merge_vars"]] == [
+        "Alice@Example.com", " bob@example.com", "carol@example.com"
+    ]
@@ -0,0 +1,42 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("aiohttp")
+pytest.importorskip("pydantic_settings")
+
+from app.services.meta_ads_service import CONVERSION_ACTION_TYPES, _conversion_counts
+
+
+def per_row_conversions(row):
+    """The original loop over one row's actions"""
+    return sum(
+        int(action.get('value', 0))
+        for action in row.get('actions', ())
+        if action.get('action_type') in CONVERSION_ACTION_TYPES
+    )
+
+
+ROWS = [
+    {'actions': [
+        {'action_type': 'purchase', 'value': '3'},
+        {'action_type': 'link_click', 'value': '40'},
+        {'action_type': 'lead', 'value': '2'},
+    ]},
+    {'impressions': '100'},
+    {'actions': [{'action_type': 'complete_registration', 'value': '1'}]},
+    {'actions': []},
+    {'actions': [{'action_type': 'link_click', 'value': '5'}]},
+]
+
+
+def test_conversion_counts_match_per_row_loop():
+    counts = _conversion_counts(pd.DataFrame(ROWS))
+
+    assert counts.tolist() == [per_row_conversions(row) for row in ROWS]
+
+
+def test_conversion_counts_without_actions():
+    rows = [{'impressions': '1'}, {'impressions': '2'}]
+
+    assert _conversion_counts(pd.DataFrame(rows)).tolist() == [0, 0]
+    assert _conversion_counts(pd.DataFrame([])).tolist() == []
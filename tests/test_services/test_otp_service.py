@@ -0,0 +1,31 @@
+import hashlib
+import hmac
+
+import pytest
+
+pytest.importorskip("pymysql")
+pytest.importorskip("redis")
+pytest.importorskip("fastapi")
+pytest.importorskip("pydantic_settings")
+
+from app.core.config import settings
+from app.services.otp_service import OTPService
+
+
+def test_generate_otp():
+    otp, otp_hash = OTPService().generate_otp()
+
+    assert len(otp) == 6 and otp.isdigit()
+    assert otp_hash == hmac.new(
+        settings.SECRET_KEY.encode(), otp.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def test_generate_otp_length():
+    otp, _ = OTPService().generate_otp(length=8)
+
+    assert len(otp) == 8 and otp.isdigit()
+
+
+def test_generate_otp_is_random():
+    assert len({OTPService().generate_otp()[0] for _ in range(50)}) > 1
@@ -0,0 +1,33 @@
+import pytest
+
+redis = pytest.importorskip("redis")
+pytest.importorskip("orjson")
+pytest.importorskip("pydantic_settings")
+
+from app.utils import redis_client, report_cache
+
+
+class DownRedis:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        raise redis.ConnectionError("down")
+
+    def set(self, key, value, ex=None):
+        self.calls += 1
+        raise redis.ConnectionError("down")
+
+
+def test_redis_skipped_after_failure(monkeypatch):
+    client = DownRedis()
+    monkeypatch.setattr(report_cache, "get_redis", lambda: client)
+    monkeypatch.setattr(redis_client, "_redis_down_until", 0.0)
+
+    assert report_cache.get_cached_report("k") is None
+    report_cache.set_cached_report("k", {"a": 1}, 60)
+    assert report_cache.get_cached_report("k") is None
+
+    assert client.calls == 1
+    assert not redis_client.redis_available()
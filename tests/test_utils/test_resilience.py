@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from app.utils import resilience
+from app.utils.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    async_call_with_retry,
+    call_with_retry,
+    is_transient_http_error,
+)
+
+
+def http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+class Flaky:
+    """Callable failing with the given errors before returning 'ok'"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(resilience.time, "sleep", lambda seconds: None)
+    return now
+
+
+def test_transient_http_errors():
+    assert is_transient_http_error(requests.ConnectionError())
+    assert is_transient_http_error(requests.ReadTimeout())
+    assert is_transient_http_error(http_error(429))
+    assert is_transient_http_error(http_error(503))
+    assert not is_transient_http_error(http_error(400))
+    assert not is_transient_http_error(ValueError())
+
+
+def test_retries_transient_errors_until_success(clock):
+    func = Flaky(requests.ConnectionError(), http_error(502))
+    breaker = CircuitBreaker("test", fail_max=1)
+
+    assert call_with_retry(func, breaker=breaker, attempts=3) == "ok"
+    assert func.calls == 3
+    assert not breaker.is_open
+
+
+def test_non_retryable_error_raised_immediately(clock):
+    func = Flaky(http_error(400))
+    breaker = CircuitBreaker("test", fail_max=1)
+
+    with pytest.raises(requests.HTTPError):
+        call_with_retry(func, breaker=breaker)
+    assert func.calls == 1
+    assert not breaker.is_open
+
+
+def test_custom_retry_if(clock):
+    func = Flaky(requests.ReadTimeout())
+
+    with pytest.raises(requests.ReadTimeout):
+        call_with_retry(func, retry_if=lambda e: not isinstance(e, requests.Timeout))
+    assert func.calls == 1
+
+
+def test_breaker_opens_after_fail_max_exhausted_calls(clock):
+    breaker = CircuitBreaker("test", fail_max=2, reset_timeout=30)
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            call_with_retry(Flaky(*[requests.ConnectionError()] * 3), breaker=breaker)
+    assert breaker.is_open
+
+    func = Flaky()
+    with pytest.raises(CircuitOpenError):
+        call_with_retry(func, breaker=breaker)
+    assert func.calls == 0
+
+
+def test_half_open_success_closes_breaker(clock):
+    breaker = CircuitBreaker("test", fail_max=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.is_open
+
+    clock[0] += 30
+    assert not breaker.is_open
+    assert call_with_retry(Flaky(), breaker=breaker) == "ok"
+
+    # The success reset the failure count, so one failure doesn't re-open it
+    breaker.record_failure()
+    assert not breaker.is_open
+
+
+def test_half_open_failure_reopens_breaker(clock):
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock[0] += 30
+    with pytest.raises(requests.ConnectionError):
+        call_with_retry(Flaky(*[requests.ConnectionError()] * 3), breaker=breaker)
+
+    assert breaker.is_open
+    clock[0] += 29
+    assert breaker.is_open
+
+
+def test_async_call_with_retry(clock, monkeypatch):
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(resilience.asyncio, "sleep", no_sleep)
+    flaky = Flaky(requests.ConnectionError())
+
+    async def func():
+        return flaky()
+
+    assert asyncio.run(async_call_with_retry(func)) == "ok"
+    assert flaky.calls == 2
+
+    breaker = CircuitBreaker("test", fail_max=1)
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(async_call_with_retry(func, breaker=breaker))